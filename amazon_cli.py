@@ -0,0 +1,235 @@
+"""Command-line entry point for the Amazon reviews analysis
+
+    py amazon_cli.py download | ingest | report | search | dashboard | sentiment | notebook | serve | bench
+
+Heavy libraries (pandas, matplotlib, seaborn, TextBlob) are imported inside
+the subcommand that needs them, so `report` and `bench` never load plotting
+or NLP code and `--help` starts instantly.
+"""
+import argparse
+import sys
+import time
+
+DEFAULT_DB = 'amazon_reviews.db'
+
+
+def cmd_download(args):
+    """Download review (and optionally product metadata) files"""
+    from data.download_amazon import download_amazon_data, download_metadata
+    download_amazon_data()
+    if args.metadata:
+        download_metadata()
+    return 0
+
+
+def cmd_ingest(args):
+    """Load downloaded CSVs into SQLite"""
+    from scripts.init_database import initialize_amazon_database
+    ok = initialize_amazon_database(fts=args.fts, incremental=args.incremental, db_path=args.db)
+    return 0 if ok else 1
+
+
+def cmd_report(args):
+    """Print the text-only EDA report"""
+    from scripts.amazon_eda import AmazonEDA
+    AmazonEDA(args.db).generate_report(dashboard=False)
+    return 0
+
+
+def cmd_search(args):
+    """BM25-ranked full-text search with rating/category/year facets"""
+    import pandas as pd
+    from scripts.amazon_eda import AmazonEDA
+    eda = AmazonEDA(args.db)
+    hits, facets = eda.search(args.query, rating=args.rating, category=args.category,
+                              since=args.since, until=args.until, limit=args.limit, plain=args.plain)
+    if hits is None:
+        return 1
+    with pd.option_context('display.max_colwidth', 80, 'display.width', 160):
+        print(hits[['asin', 'rating', 'category', 'snippet']].to_string(index=False))
+        for name, facet in facets.items():
+            print(f"\nHits by {name}:")
+            print(facet.to_string(index=False))
+    return 0
+
+
+def cmd_dashboard(args):
+    """Render the dashboard headlessly"""
+    from scripts.amazon_eda import AmazonEDA
+    eda = AmazonEDA(args.db)
+    if args.per_category:
+        eda.render_category_dashboards(args.per_category, fmt=args.format, dpi=args.dpi,
+                                       max_workers=args.workers, force=args.force)
+    else:
+        path = eda.create_dashboard(args.output, fmt=args.format, dpi=args.dpi,
+                                    headless=True, force=args.force)
+        print(f"🖼️ Dashboard: {path}")
+    return 0
+
+
+def cmd_sentiment(args):
+    """Score a sample of reviews and plot sentiment vs rating"""
+    try:
+        from scripts.sentiment_analysis import SentimentAnalysis
+        sa = SentimentAnalysis(args.db)
+        reviews = sa.analyze_sentiment(args.sample)
+    except ImportError:
+        print("❌ TextBlob not installed.")
+        print("💡 Run: pip install textblob && python -m textblob.download_corpora")
+        return 1
+    sa.sentiment_vs_rating(reviews, args.output, fmt=args.format, dpi=args.dpi,
+                           headless=True, force=args.force, kind=args.kind)
+    return 0
+
+
+def cmd_notebook(args):
+    """Export summary artifacts and generate (optionally execute) the notebook"""
+    from create_notebook import create_notebook, execute_notebook, export_artifacts
+    if not args.no_export and not export_artifacts(args.db, args.artifacts):
+        return 1
+    create_notebook(args.output, args.artifacts)
+    if args.execute and not execute_notebook(args.output):
+        return 1
+    return 0
+
+
+def cmd_serve(args):
+    """Run the read-only JSON query service"""
+    import asyncio
+    from scripts.query_service import QueryService
+    service = QueryService(args.db, pool_size=args.pool_size, cache_ttl=args.cache_ttl,
+                           cache_size=args.cache_size)
+    try:
+        asyncio.run(service.serve_forever(args.host, args.port))
+    except KeyboardInterrupt:
+        print("\n👋 Query service stopped")
+    return 0
+
+
+def cmd_bench_service(args):
+    """Load-test an embedded query service at a fixed concurrency"""
+    import asyncio
+    from scripts.query_service import run_benchmark
+    print(f"⏱️ Load-testing query service on {args.db}: {args.requests} requests, "
+          f"concurrency {args.concurrency}, cache ttl {args.cache_ttl}s")
+    result = asyncio.run(run_benchmark(args.db, concurrency=args.concurrency, total=args.requests,
+                                       cache_ttl=args.cache_ttl, pool_size=args.pool_size))
+    print(f"   p50 {result['p50_ms']:.2f} ms   p99 {result['p99_ms']:.2f} ms   "
+          f"{result['throughput_rps']:,.0f} req/s   ({result['errors']} errors)")
+    print(f"   {result['queries']} queries run, {result['cache_hits']} cache hits, "
+          f"{result['coalesced']} coalesced")
+    return 0 if result['errors'] == 0 else 1
+
+
+def cmd_bench(args):
+    """Time each text analysis and the dashboard aggregate queries"""
+    import contextlib
+    import io
+    from scripts.amazon_eda import AmazonEDA
+
+    if args.service:
+        return cmd_bench_service(args)
+
+    eda = AmazonEDA(args.db)
+    steps = ['basic_overview', 'rating_analysis', 'product_analysis', 'reviewer_analysis',
+             'category_analysis', 'helpfulness_analysis', 'dashboard_aggregates']
+
+    print(f"⏱️ Benchmarking {args.db} ({args.repeat} runs each)")
+    for step in steps:
+        timings = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                getattr(eda, step)()
+            timings.append(time.perf_counter() - start)
+        print(f"   {step:<22} best {min(timings) * 1000:8.1f} ms   "
+              f"mean {sum(timings) / len(timings) * 1000:8.1f} ms")
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='amazon_cli', description="Amazon product reviews EDA")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    download = sub.add_parser('download', help="download the review datasets")
+    download.add_argument('--metadata', action='store_true', help="also download product metadata")
+    download.set_defaults(func=cmd_download)
+
+    ingest = sub.add_parser('ingest', help="load CSVs into SQLite")
+    ingest.add_argument('--db', default=DEFAULT_DB)
+    ingest.add_argument('--fts', action='store_true', help="build the full-text search index")
+    ingest.add_argument('--incremental', action='store_true', help="append new reviews instead of replacing")
+    ingest.set_defaults(func=cmd_ingest)
+
+    report = sub.add_parser('report', help="print the text EDA report")
+    report.add_argument('--db', default=DEFAULT_DB)
+    report.set_defaults(func=cmd_report)
+
+    search = sub.add_parser('search', help="full-text search over review text (needs ingest --fts)")
+    search.add_argument('query', help="FTS5 query, e.g. battery or '\"broke after\"'")
+    search.add_argument('--db', default=DEFAULT_DB)
+    search.add_argument('--rating', type=int, choices=range(1, 6))
+    search.add_argument('--category')
+    search.add_argument('--since', help="date or unix time")
+    search.add_argument('--until', help="date or unix time")
+    search.add_argument('--limit', type=int, default=20)
+    search.add_argument('--plain', action='store_true', help="match the words literally (e.g. wi-fi, USB-C, don't)")
+    search.set_defaults(func=cmd_search)
+
+    dashboard = sub.add_parser('dashboard', help="render the dashboard headlessly")
+    dashboard.add_argument('--db', default=DEFAULT_DB)
+    dashboard.add_argument('--output', default='amazon_analysis_dashboard.png')
+    dashboard.add_argument('--format', default='png', choices=['png', 'svg', 'pdf'])
+    dashboard.add_argument('--dpi', type=int, default=150)
+    dashboard.add_argument('--per-category', metavar='DIR', help="render one dashboard per category into DIR")
+    dashboard.add_argument('--workers', type=int, default=None)
+    dashboard.add_argument('--force', action='store_true', help="redraw even if aggregates are unchanged")
+    dashboard.set_defaults(func=cmd_dashboard)
+
+    sentiment = sub.add_parser('sentiment', help="sentiment vs rating analysis")
+    sentiment.add_argument('--db', default=DEFAULT_DB)
+    sentiment.add_argument('--sample', type=int, default=500)
+    sentiment.add_argument('--output', default='sentiment_vs_rating.png')
+    sentiment.add_argument('--format', default='png', choices=['png', 'svg', 'pdf'])
+    sentiment.add_argument('--dpi', type=int, default=150)
+    sentiment.add_argument('--kind', default='box', choices=['box', 'violin'])
+    sentiment.add_argument('--force', action='store_true')
+    sentiment.set_defaults(func=cmd_sentiment)
+
+    notebook = sub.add_parser('notebook', help="export summary artifacts and build the EDA notebook")
+    notebook.add_argument('--db', default=DEFAULT_DB)
+    notebook.add_argument('--artifacts', default='artifacts')
+    notebook.add_argument('--output', default='amazon_eda_notebook.ipynb')
+    notebook.add_argument('--no-export', action='store_true', help="reuse existing artifacts")
+    notebook.add_argument('--execute', action='store_true', help="run headlessly and embed outputs")
+    notebook.set_defaults(func=cmd_notebook)
+
+    serve = sub.add_parser('serve', help="run the read-only JSON query service")
+    serve.add_argument('--db', default=DEFAULT_DB)
+    serve.add_argument('--host', default='127.0.0.1')
+    serve.add_argument('--port', type=int, default=8765)
+    serve.add_argument('--pool-size', type=int, default=4, help="read-only connections")
+    serve.add_argument('--cache-ttl', type=float, default=30.0, help="seconds; 0 disables the cache")
+    serve.add_argument('--cache-size', type=int, default=1024, help="max cached responses")
+    serve.set_defaults(func=cmd_serve)
+
+    bench = sub.add_parser('bench', help="time the analysis queries (or load-test the service)")
+    bench.add_argument('--db', default=DEFAULT_DB)
+    bench.add_argument('--repeat', type=int, default=3)
+    bench.add_argument('--service', action='store_true', help="load-test an embedded query service")
+    bench.add_argument('--concurrency', type=int, default=16)
+    bench.add_argument('--requests', type=int, default=2000)
+    bench.add_argument('--pool-size', type=int, default=4)
+    bench.add_argument('--cache-ttl', type=float, default=30.0)
+    bench.set_defaults(func=cmd_bench)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,66 +1,322 @@
+import argparse
+import contextlib
+import io
 import json
+import os
+import time
+from datetime import datetime
 
-# Create the notebook structure
-notebook_content = {
-    "cells": [
-        {
-            "cell_type": "markdown",
-            "metadata": {},
-            "source": [
-                "# Amazon Product Reviews - Exploratory Data Analysis\n",
-                "## Comprehensive EDA Notebook for Amazon Dataset"
-            ]
-        },
-        {
-            "cell_type": "code",
-            "execution_count": None,
-            "metadata": {},
-            "outputs": [],
-            "source": [
-                "import pandas as pd\n",
-                "import numpy as np\n",
-                "import matplotlib.pyplot as plt\n",
-                "import seaborn as sns\n",
-                "import sqlite3\n",
-                "from datetime import datetime\n",
-                "import warnings\n",
-                "warnings.filterwarnings('ignore')\n",
-                "\n",
-                "# Set up plotting style\n",
-                "plt.style.use('seaborn-v0_8')\n",
-                "sns.set_palette(\"husl\")\n",
-                "%matplotlib inline\n",
-                "\n",
-                "print(\"✅ Libraries imported successfully!\")"
-            ]
-        },
-        # ... continue with all the other cells from the provided content
-    ],
-    "metadata": {
-        "kernelspec": {
-            "display_name": "Python 3",
-            "language": "python",
-            "name": "python3"
-        },
-        "language_info": {
-            "codemirror_mode": {
-                "name": "ipython",
-                "version": 3
-            },
-            "file_extension": ".py",
-            "mimetype": "text/x-python",
-            "name": "python",
-            "nbconvert_exporter": "python",
-            "pygments_lexer": "ipython3",
-            "version": "3.8.0"
+DEFAULT_DB = 'amazon_reviews.db'
+DEFAULT_ARTIFACTS = 'artifacts'
+DEFAULT_NOTEBOOK = 'amazon_eda_notebook.ipynb'
+
+# Fine-grained length buckets; the notebook can re-bucket these without the database
+LENGTH_EDGES = list(range(0, 2001, 50)) + [float('inf')]
+
+
+def export_artifacts(db_path=DEFAULT_DB, out_dir=DEFAULT_ARTIFACTS, sample_size=2000, seed=42):
+    """Export compact summary artifacts (rollups, sketches, samples) as Parquet
+
+    Everything the notebook shows is computed here once, so opening the
+    notebook never queries the full database. Writes out_dir/manifest.json
+    with row counts, sizes and export timings.
+    """
+    try:
+        import pyarrow  # noqa: F401  (pandas.to_parquet engine)
+    except ImportError:
+        print("❌ pyarrow not installed. Run: pip install pyarrow")
+        return False
+
+    import numpy as np
+    import pandas as pd
+    from scripts import queries
+    from scripts.amazon_eda import AmazonEDA
+
+    os.makedirs(out_dir, exist_ok=True)
+    eda = AmazonEDA(db_path)
+    print(f"📦 Exporting summary artifacts to {out_dir}/ ...")
+
+    def overview():
+        return pd.DataFrame([queries.overview(eda.conn)])
+
+    def sample():
+        # Pick random rowids instead of ORDER BY RANDOM(), which sorts the whole table
+        max_rowid = eda.conn.execute("SELECT MAX(rowid) FROM reviews").fetchone()[0] or 0
+        rng = np.random.default_rng(seed)
+        rowids = rng.choice(max_rowid, size=min(max_rowid, int(sample_size * 1.2)), replace=False) + 1
+        placeholders = ','.join('?' * len(rowids))
+        rows = pd.read_sql_query(f'''
+            SELECT asin, reviewerID, overall, category, helpful, unixReviewTime, summary,
+                   SUBSTR(reviewText, 1, 280) as review_excerpt,
+                   review_length, word_count, summary_length, non_ascii_permille
+            FROM reviews
+            WHERE rowid IN ({placeholders})
+        ''', eda.conn, params=[int(r) for r in rowids])
+        return rows.head(sample_size)
+
+    with contextlib.closing(eda.conn), contextlib.redirect_stdout(io.StringIO()):
+        exports = {
+            # Rollups
+            'overview': overview,
+            'rating_distribution': lambda: eda.rating_analysis()[0],
+            'monthly_ratings': lambda: eda.review_time_series(freq='month'),
+            'top_products': lambda: eda.product_analysis()[0],
+            'top_reviewers': lambda: eda.reviewer_analysis()[0],
+            'category_stats': eda.category_analysis,
+            'helpfulness': lambda: eda.helpfulness_analysis()[0],
+            'helpfulness_by_rating': lambda: eda.helpfulness_analysis()[1],
+            'reviewer_activity': lambda: eda.dashboard_aggregates()['reviewer'],
+            # Sketches
+            'length_histogram': lambda: eda.text_stat_histogram(LENGTH_EDGES, by='overall'),
+            'length_quantiles': lambda: eda.text_stat_quantiles(by='category').rename(columns=str).reset_index(names='category'),
+            'word_count_quantiles': lambda: eda.text_stat_quantiles(column='word_count', by='overall').rename(columns=str).reset_index(names='rating'),
+            # Samples
+            'review_sample': sample,
+        }
+
+        manifest = {
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'database': os.path.abspath(db_path),
+            'data_version': eda.columns.data_version(),
+            'artifacts': {},
         }
-    },
-    "nbformat": 4,
-    "nbformat_minor": 4
-}
+        for name, build in exports.items():
+            start = time.perf_counter()
+            frame = build()
+            path = os.path.join(out_dir, f'{name}.parquet')
+            frame.to_parquet(path, index=False)
+            manifest['artifacts'][name] = {
+                'rows': len(frame),
+                'bytes': os.path.getsize(path),
+                'seconds': round(time.perf_counter() - start, 3),
+            }
+
+    with open(os.path.join(out_dir, 'manifest.json'), 'w') as f:
+        json.dump(manifest, f, indent=2)
+
+    total_kb = sum(a['bytes'] for a in manifest['artifacts'].values()) / 1024
+    print(f"✅ Exported {len(exports)} artifacts ({total_kb:,.0f} KB)")
+    return True
+
+
+def markdown_cell(*lines):
+    return {"cell_type": "markdown", "metadata": {}, "source": list(lines)}
+
+
+def code_cell(*lines):
+    return {"cell_type": "code", "execution_count": None, "metadata": {}, "outputs": [], "source": list(lines)}
+
+
+def _source(text):
+    """Split a code block into notebook source lines"""
+    lines = text.strip('\n').split('\n')
+    return [line + '\n' for line in lines[:-1]] + lines[-1:]
+
+
+def build_notebook(artifact_dir=DEFAULT_ARTIFACTS):
+    """Notebook whose cells load the exported artifacts lazily instead of querying SQLite"""
+    cells = [
+        markdown_cell(
+            "# Amazon Product Reviews - Exploratory Data Analysis\n",
+            "## Comprehensive EDA Notebook for Amazon Dataset\n",
+            "\n",
+            f"Cells read the small Parquet artifacts in `{artifact_dir}/` (regenerate with "
+            "`py create_notebook.py --export`), never the full database."
+        ),
+        code_cell(*_source(f'''
+import json
+from functools import lru_cache
+from pathlib import Path
+from datetime import datetime
+
+import pandas as pd
+import matplotlib.pyplot as plt
+import seaborn as sns
+import warnings
+warnings.filterwarnings('ignore')
+
+# Set up plotting style
+plt.style.use('seaborn-v0_8')
+sns.set_palette("husl")
+%matplotlib inline
+
+ARTIFACTS = Path({artifact_dir!r})
+
+@lru_cache(maxsize=None)
+def load(name):
+    """Read one summary artifact on first use"""
+    return pd.read_parquet(ARTIFACTS / f'{{name}}.parquet')
+
+manifest = json.loads((ARTIFACTS / 'manifest.json').read_text())
+print(f"✅ {{len(manifest['artifacts'])}} artifacts from {{manifest['created']}} (data version {{manifest['data_version']}})")
+''')),
+        markdown_cell("## Dataset Overview"),
+        code_cell(*_source('''
+overview = load('overview').iloc[0]
+print(f"Total Reviews: {overview['total_reviews']:,}")
+print(f"Unique Products: {overview['unique_products']:,}")
+print(f"Unique Reviewers: {overview['unique_reviewers']:,}")
+print(f"Average Rating: {overview['avg_rating']:.2f}/5.0")
+first = datetime.fromtimestamp(overview['first_review']).strftime('%Y-%m-%d')
+last = datetime.fromtimestamp(overview['last_review']).strftime('%Y-%m-%d')
+print(f"Review Period: {first} to {last}")
+''')),
+        markdown_cell("## Rating Distribution"),
+        code_cell(*_source('''
+ratings = load('rating_distribution').sort_values('rating')
+ax = ratings.plot.bar(x='rating', y='count', color='skyblue', legend=False, figsize=(8, 4))
+ax.set_title('Rating Distribution', fontweight='bold')
+ax.set_ylabel('Number of Reviews')
+ratings
+''')),
+        markdown_cell("## Reviews Over Time"),
+        code_cell(*_source('''
+monthly = load('monthly_ratings')
+fig, ax1 = plt.subplots(figsize=(12, 4))
+ax1.plot(monthly['period'], monthly['review_count'], linewidth=1.5)
+ax1.set_ylabel('Number of Reviews')
+ax2 = ax1.twinx()
+ax2.plot(monthly['period'], monthly['avg_rating'], color='coral', alpha=0.6)
+ax2.set_ylabel('Average Rating')
+ax1.set_title('Monthly Review Volume and Rating', fontweight='bold')
+plt.show()
+''')),
+        markdown_cell("## Products and Reviewers"),
+        code_cell(*_source('''
+display(load('top_products'))
+display(load('top_reviewers'))
+activity = load('reviewer_activity')
+activity.set_index('activity_level')['reviewer_count'].plot.pie(autopct='%1.1f%%', figsize=(5, 5))
+plt.title('Reviewer Activity Levels', fontweight='bold')
+plt.ylabel('')
+plt.show()
+''')),
+        markdown_cell("## Category Analysis"),
+        code_cell(*_source('''
+categories = load('category_stats')
+fig, axes = plt.subplots(1, 2, figsize=(12, 4))
+categories.plot.bar(x='category', y='review_count', ax=axes[0], legend=False, title='Reviews by Category')
+categories.plot.bar(x='category', y='avg_rating', ax=axes[1], legend=False, color='coral', title='Average Rating')
+plt.tight_layout()
+plt.show()
+categories
+''')),
+        markdown_cell("## Review Length"),
+        code_cell(*_source('''
+lengths = load('length_histogram')
+by_bin = lengths.groupby('left', as_index=False)['count'].sum()
+ax = by_bin.plot.bar(x='left', y='count', color='lightgreen', legend=False, figsize=(14, 4), width=1.0)
+ax.set_title('Review Length Distribution (50-char buckets)', fontweight='bold')
+ax.set_xlabel('Review Length (chars)')
+plt.show()
+load('length_quantiles')
+''')),
+        markdown_cell("## Helpfulness"),
+        code_cell(*_source('''
+display(load('helpfulness'))
+ax = load('helpfulness_by_rating').plot(x='rating', y='avg_helpful_votes', marker='s', color='coral', legend=False)
+ax.set_title('Helpfulness vs Rating', fontweight='bold')
+plt.show()
+''')),
+        markdown_cell("## Review Sample"),
+        code_cell(*_source('''
+sample = load('review_sample')
+print(f"{len(sample):,} sampled reviews")
+sample.head(10)
+''')),
+    ]
+
+    return {
+        "cells": cells,
+        "metadata": {
+            "kernelspec": {
+                "display_name": "Python 3",
+                "language": "python",
+                "name": "python3"
+            },
+            "language_info": {
+                "codemirror_mode": {
+                    "name": "ipython",
+                    "version": 3
+                },
+                "file_extension": ".py",
+                "mimetype": "text/x-python",
+                "name": "python",
+                "nbconvert_exporter": "python",
+                "pygments_lexer": "ipython3",
+                "version": "3.8.0"
+            }
+        },
+        "nbformat": 4,
+        "nbformat_minor": 4
+    }
+
+
+def execute_notebook(path, timeout=600):
+    """Execute a notebook headlessly, embed its outputs and report per-cell timings
+
+    Writes the timings next to the notebook as <name>.timing.json.
+    """
+    try:
+        import nbformat
+        from nbclient import NotebookClient
+    except ImportError:
+        print("❌ nbclient not installed. Run: pip install nbclient ipykernel")
+        return False
+
+    nb = nbformat.read(path, as_version=4)
+    print(f"▶️ Executing {path}...")
+    start = time.perf_counter()
+    NotebookClient(nb, timeout=timeout, kernel_name='python3',
+                   resources={'metadata': {'path': os.path.dirname(os.path.abspath(path))}}).execute()
+    total = time.perf_counter() - start
+    nbformat.write(nb, path)
+
+    timings = []
+    for index, cell in enumerate(nb.cells):
+        execution = cell.metadata.get('execution', {})
+        if cell.cell_type != 'code' or 'iopub.execute_input' not in execution:
+            continue
+        started = datetime.fromisoformat(execution['iopub.execute_input'].replace('Z', '+00:00'))
+        finished = datetime.fromisoformat(execution['shell.execute_reply'].replace('Z', '+00:00'))
+        first_line = cell.source.strip().split('\n')[0][:50]
+        timings.append({'cell': index, 'seconds': round((finished - started).total_seconds(), 3), 'source': first_line})
+
+    print("⏱️ Cell timings:")
+    for timing in timings:
+        print(f"   [{timing['cell']:>2}] {timing['seconds']:7.3f}s  {timing['source']}")
+    print(f"   Total (including kernel start): {total:.1f}s")
+
+    with open(os.path.splitext(path)[0] + '.timing.json', 'w') as f:
+        json.dump({'total_seconds': round(total, 3), 'cells': timings}, f, indent=2)
+    return True
+
+
+def create_notebook(output=DEFAULT_NOTEBOOK, artifact_dir=DEFAULT_ARTIFACTS):
+    """Write the artifact-backed notebook"""
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(build_notebook(artifact_dir), f, indent=1, ensure_ascii=False)
+    print(f"✅ Jupyter notebook created successfully: {output}")
+    return True
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate the artifact-backed EDA notebook")
+    parser.add_argument('--db', default=DEFAULT_DB)
+    parser.add_argument('--artifacts', default=DEFAULT_ARTIFACTS, help="summary artifact directory")
+    parser.add_argument('--output', default=DEFAULT_NOTEBOOK)
+    parser.add_argument('--export', action='store_true', help="(re)export artifacts from the database first")
+    parser.add_argument('--execute', action='store_true', help="run the notebook headlessly and embed outputs")
+    parser.add_argument('--timeout', type=int, default=600, help="per-cell timeout in seconds")
+    args = parser.parse_args(argv)
+
+    if args.export and not export_artifacts(args.db, args.artifacts):
+        return 1
+    create_notebook(args.output, args.artifacts)
+    if args.execute and not execute_notebook(args.output, args.timeout):
+        return 1
+    return 0
 
-# Save as .ipynb file
-with open('amazon_eda_notebook.ipynb', 'w') as f:
-    json.dump(notebook_content, f)
 
-print("✅ Jupyter notebook created successfully!")
\ No newline at end of file
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -5,10 +5,56 @@ from io import StringIO
 import gzip
 import json
 
+DOWNLOAD_STATE = 'data/download_state.json'
+
+def _load_download_state():
+    if os.path.exists(DOWNLOAD_STATE):
+        with open(DOWNLOAD_STATE) as f:
+            return json.load(f)
+    return {}
+
+def _save_download_state(state):
+    with open(DOWNLOAD_STATE, 'w') as f:
+        json.dump(state, f, indent=2)
+
+def fetch_if_changed(url, gz_path, output_csv, state):
+    """Download url to gz_path unless the server says it is unchanged since the last fetch
+    
+    Sends the stored ETag / Last-Modified as If-None-Match / If-Modified-Since
+    (only when output_csv already exists) and returns False on 304 Not Modified.
+    """
+    headers = {}
+    validators = state.get(url, {})
+    if os.path.exists(output_csv):
+        if validators.get('etag'):
+            headers['If-None-Match'] = validators['etag']
+        if validators.get('last_modified'):
+            headers['If-Modified-Since'] = validators['last_modified']
+    
+    response = requests.get(url, stream=True, headers=headers)
+    if response.status_code == 304:
+        return False
+    response.raise_for_status()
+    
+    with open(gz_path, 'wb') as f:
+        for chunk in response.iter_content(chunk_size=8192):
+            f.write(chunk)
+    state[url] = {
+        'etag': response.headers.get('ETag'),
+        'last_modified': response.headers.get('Last-Modified'),
+    }
+    return True
+
 def download_amazon_data():
-    """Download Amazon product review data"""
+    """Download Amazon product review data
+    
+    Re-downloads only datasets that changed on the server (conditional GET), so
+    it is cheap to run on every pipeline run; unchanged CSVs keep their content
+    hash and downstream stages are skipped.
+    """
     
     os.makedirs('data', exist_ok=True)
+    state = _load_download_state()
     
     # Amazon product data sources (smaller subsets for demo)
     datasets = {
@@ -23,18 +69,15 @@ def download_amazon_data():
         try:
             print(f"Downloading {category} reviews...")
             
-            # Download and extract
-            response = requests.get(url, stream=True)
-            response.raise_for_status()
-            
-            # Save compressed file
+            # Download (if changed) and extract
             gz_path = f'data/reviews_{category}.json.gz'
-            with open(gz_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+            if not fetch_if_changed(url, gz_path, f'data/amazon_reviews_{category}.csv', state):
+                print(f"⏭️ {category} unchanged on server")
+                continue
             
             # Extract and convert to CSV
             extract_amazon_reviews(gz_path, category)
+            _save_download_state(state)
             print(f"✅ {category} data processed")
             
         except Exception as e:
@@ -74,6 +117,7 @@ def extract_amazon_reviews(gz_path, category):
 def download_metadata():
     """Download product metadata"""
     print("\n📋 Downloading product metadata...")
+    state = _load_download_state()
     
     # Product metadata (small subset)
     metadata_urls = {
@@ -84,15 +128,13 @@ def download_metadata():
     for category, url in metadata_urls.items():
         try:
             print(f"Downloading {category} metadata...")
-            response = requests.get(url, stream=True)
-            response.raise_for_status()
-            
             gz_path = f'data/metadata_{category}.json.gz'
-            with open(gz_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+            if not fetch_if_changed(url, gz_path, f'data/amazon_products_{category}.csv', state):
+                print(f"⏭️ {category} metadata unchanged on server")
+                continue
             
             extract_metadata(gz_path, category)
+            _save_download_state(state)
             
         except Exception as e:
             print(f"❌ Error downloading {category} metadata: {e}")
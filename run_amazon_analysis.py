@@ -1,49 +1,119 @@
-import os
-import sys
+import argparse
+import contextlib
 
-def main():
-    """Main execution script for Amazon Reviews Analysis"""
-    
-    print("🛍️ AMAZON PRODUCT REVIEWS ANALYSIS")
-    print("="*50)
-    
-    # Check if data exists
-    if not os.path.exists('data/amazon_reviews_electronics.csv'):
-        print("📥 Downloading Amazon dataset...")
-        from data.download_amazon import download_amazon_data
-        download_amazon_data()
-        
-        if not os.path.exists('data/amazon_reviews_electronics.csv'):
-            print("❌ Download failed. Please check manual download instructions.")
-            return
-    
-    # Initialize database
+from scripts.pipeline import Pipeline, Stage
+
+REVIEW_CSVS = 'data/amazon_reviews_*.csv'
+PRODUCT_CSVS = 'data/amazon_products_*.csv'
+DATABASE = 'amazon_reviews.db'
+REPORT = 'amazon_report.txt'
+DASHBOARD = 'amazon_analysis_dashboard.png'
+SENTIMENT_PLOT = 'sentiment_vs_rating.png'
+ARTIFACT_MANIFEST = 'artifacts/manifest.json'
+NOTEBOOK = 'amazon_eda_notebook.ipynb'
+
+
+def download_stage():
+    """Download the Amazon review CSVs (only datasets that changed on the server)"""
+    print("📥 Downloading Amazon dataset...")
+    from data.download_amazon import download_amazon_data
+    download_amazon_data()
+
+
+def ingest_stage():
+    """Load the CSVs into SQLite"""
     print("🗃️ Initializing database...")
     from scripts.init_database import initialize_amazon_database
-    if not initialize_amazon_database():
-        return
-    
-    # Run main EDA
+    return initialize_amazon_database()
+
+
+def report_stage():
+    """Write the text EDA report"""
     print("📊 Running EDA analysis...")
     from scripts.amazon_eda import AmazonEDA
-    eda = AmazonEDA()
-    eda.generate_report()
-    
-    # Run sentiment analysis (optional)
+    with open(REPORT, 'w', encoding='utf-8') as f, contextlib.redirect_stdout(f):
+        AmazonEDA(DATABASE).generate_report(dashboard=False)
+
+
+def dashboard_stage():
+    """Render the dashboard headlessly"""
+    print("🖼️ Rendering dashboard...")
+    from scripts.amazon_eda import AmazonEDA
+    AmazonEDA(DATABASE).create_dashboard(DASHBOARD, headless=True)
+
+
+def sentiment_stage():
+    """Score a sample of reviews and plot sentiment vs rating"""
     try:
         print("\n🧠 Running sentiment analysis...")
         from scripts.sentiment_analysis import SentimentAnalysis
-        sa = SentimentAnalysis()
+        sa = SentimentAnalysis(DATABASE)
         reviews = sa.analyze_sentiment(500)
-        sa.sentiment_vs_rating(reviews)
+        sa.sentiment_vs_rating(reviews, SENTIMENT_PLOT, headless=True)
     except ImportError:
         print("❌ TextBlob not installed. Skipping sentiment analysis.")
         print("💡 Run: pip install textblob && python -m textblob.download_corpora")
-    
-    print("\n✅ Analysis complete!")
+
+
+def artifacts_stage():
+    """Export Parquet summary artifacts for the notebook"""
+    from create_notebook import export_artifacts
+    return export_artifacts(DATABASE)
+
+
+def notebook_stage():
+    """Regenerate the artifact-backed notebook"""
+    from create_notebook import create_notebook
+    return create_notebook(NOTEBOOK)
+
+
+STAGES = [
+    Stage('download', download_stage, outputs=[REVIEW_CSVS], always=True),
+    Stage('ingest', ingest_stage, inputs=[REVIEW_CSVS, PRODUCT_CSVS], outputs=[DATABASE]),
+    Stage('report', report_stage, inputs=[DATABASE], outputs=[REPORT]),
+    Stage('dashboard', dashboard_stage, inputs=[DATABASE], outputs=[DASHBOARD]),
+    Stage('sentiment', sentiment_stage, inputs=[DATABASE], outputs=[SENTIMENT_PLOT]),
+    Stage('artifacts', artifacts_stage, inputs=[DATABASE], outputs=[ARTIFACT_MANIFEST]),
+    Stage('notebook', notebook_stage, inputs=[ARTIFACT_MANIFEST], outputs=[NOTEBOOK]),
+]
+
+
+def main(force=(), max_workers=None):
+    """Main execution script for Amazon Reviews Analysis
+
+    Runs download -> ingest -> (report | dashboard | sentiment | artifacts -> notebook). Download runs
+    every time (a conditional GET per dataset); every other stage is skipped when its inputs are
+    unchanged since the last run.
+    """
+
+    print("🛍️ AMAZON PRODUCT REVIEWS ANALYSIS")
+    print("="*50)
+
+    pipeline = Pipeline(STAGES, max_workers=max_workers)
+    ok = pipeline.run(force=force)
+
+    if ok:
+        print("\n✅ Analysis complete!")
+    else:
+        print("\n⚠️ Analysis finished with failed stages (see pipeline_manifest.json).")
+        print("💡 If the download failed, check the manual download instructions.")
     print("📈 Check generated files:")
-    print("   - amazon_analysis_dashboard.png")
-    print("   - sentiment_vs_rating.png (if sentiment analysis ran)")
+    print(f"   - {REPORT}")
+    print(f"   - {DASHBOARD}")
+    print(f"   - {SENTIMENT_PLOT} (if sentiment analysis ran)")
+    print(f"   - {NOTEBOOK} (reads the summaries in artifacts/)")
+    print(f"   - {pipeline.manifest_path} (stage timings)")
+    return ok
+
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Run the Amazon reviews analysis pipeline")
+    parser.add_argument('--force', nargs='*', default=None, metavar='STAGE',
+                        help="re-run these stages even if their inputs are unchanged (no names = all)")
+    parser.add_argument('--workers', type=int, default=None, help="max parallel stages")
+    args = parser.parse_args()
+
+    force = args.force or []
+    if args.force == []:
+        force = [stage.name for stage in STAGES]
+    main(force=force, max_workers=args.workers)
@@ -1,36 +1,58 @@
 import sqlite3
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
 import numpy as np
+import os
 from datetime import datetime
 import warnings
 warnings.filterwarnings('ignore')
 
-plt.style.use('seaborn-v0_8')
-sns.set_palette("husl")
+try:
+    from scripts import queries
+    from scripts.column_store import ColumnStore
+    from scripts.plot_helpers import plot_time_series
+    from scripts.rendering import (DASHBOARD_TITLE, aggregates_hash, draw_dashboard, is_fresh,
+                                   mark_fresh, pyplot, render_dashboards, save_figure,
+                                   use_headless_backend, with_format)
+except ImportError:
+    import queries
+    from column_store import ColumnStore
+    from plot_helpers import plot_time_series
+    from rendering import (DASHBOARD_TITLE, aggregates_hash, draw_dashboard, is_fresh,
+                           mark_fresh, pyplot, render_dashboards, save_figure,
+                           use_headless_backend, with_format)
+
+# Review length buckets (chars) for the dashboard; any edges work with text_stat_histogram
+LENGTH_BUCKETS = [0, 50, 200, 500, np.inf]
+
+
+def _bin_label(left, right):
+    return f"{left:g}+" if np.isinf(right) else f"{left:g}-{right:g}"
+
 
 class AmazonEDA:
     def __init__(self, db_path='amazon_reviews.db'):
         self.db_path = db_path
         self.conn = sqlite3.connect(db_path)
+        self.columns = ColumnStore(self.conn, db_path)
+    
+    def _frame(self, query, **params):
+        """Run one of the shared scripts.queries aggregates as a DataFrame
+
+        The *_analysis methods pass their **filters (category, asin, rating,
+        since, until; see queries.FILTERS) straight through to the query.
+        """
+        result = query(self.conn, **params)
+        if isinstance(result, dict):
+            return pd.DataFrame([result])
+        return pd.DataFrame(result, columns=result.columns)
     
-    def basic_overview(self):
+    def basic_overview(self, **filters):
         """Basic overview of the Amazon dataset"""
         print("🛍️ AMAZON PRODUCT REVIEWS ANALYSIS")
         print("="*60)
         
         # Basic statistics
-        stats = pd.read_sql_query('''
-            SELECT 
-                COUNT(*) as total_reviews,
-                COUNT(DISTINCT asin) as unique_products,
-                COUNT(DISTINCT reviewerID) as unique_reviewers,
-                AVG(overall) as avg_rating,
-                MIN(unixReviewTime) as first_review,
-                MAX(unixReviewTime) as last_review
-            FROM reviews
-        ''', self.conn)
+        stats = self._frame(queries.overview, **filters)
         
         print("📊 Dataset Overview:")
         print(f"   Total Reviews: {stats.iloc[0]['total_reviews']:,}")
@@ -43,21 +65,13 @@ class AmazonEDA:
         last_date = datetime.fromtimestamp(stats.iloc[0]['last_review']).strftime('%Y-%m-%d')
         print(f"   Review Period: {first_date} to {last_date}")
     
-    def rating_analysis(self):
+    def rating_analysis(self, **filters):
         """Analyze rating patterns and distributions"""
         print("\n⭐ RATING ANALYSIS")
         print("="*60)
         
         # Rating distribution
-        rating_dist = pd.read_sql_query('''
-            SELECT 
-                overall as rating,
-                COUNT(*) as count,
-                ROUND(COUNT(*) * 100.0 / (SELECT COUNT(*) FROM reviews), 2) as percentage
-            FROM reviews
-            GROUP BY overall
-            ORDER BY overall DESC
-        ''', self.conn)
+        rating_dist = self._frame(queries.rating_distribution, **filters)
         
         print("Rating Distribution:")
         for _, row in rating_dist.iterrows():
@@ -65,57 +79,27 @@ class AmazonEDA:
             print(f"   {stars} ({row['rating']}): {row['count']:,} reviews ({row['percentage']}%)")
         
         # Rating trends over time
-        monthly_ratings = pd.read_sql_query('''
-            SELECT 
-                strftime('%Y-%m', datetime(unixReviewTime, 'unixepoch')) as month,
-                AVG(overall) as avg_rating,
-                COUNT(*) as review_count
-            FROM reviews
-            GROUP BY month
-            HAVING review_count >= 10
-            ORDER BY month
-        ''', self.conn)
+        monthly_ratings = self._frame(queries.monthly_trends, **filters)
         
         print(f"\nMonthly Rating Trends ({len(monthly_ratings)} months):")
         print(f"   Average rating range: {monthly_ratings['avg_rating'].min():.2f} - {monthly_ratings['avg_rating'].max():.2f}")
         
         return rating_dist, monthly_ratings
     
-    def product_analysis(self):
+    def product_analysis(self, **filters):
         """Analyze product review patterns"""
         print("\n📦 PRODUCT ANALYSIS")
         print("="*60)
         
         # Products with most reviews
-        top_products = pd.read_sql_query('''
-            SELECT 
-                asin,
-                COUNT(*) as review_count,
-                AVG(overall) as avg_rating,
-                COUNT(DISTINCT reviewerID) as unique_reviewers
-            FROM reviews
-            GROUP BY asin
-            HAVING review_count >= 5
-            ORDER BY review_count DESC
-            LIMIT 10
-        ''', self.conn)
+        top_products = self._frame(queries.top_products, limit=10, **filters)
         
         print("Top 10 Most Reviewed Products:")
         for i, (_, row) in enumerate(top_products.iterrows(), 1):
             print(f"   {i}. Product {row['asin']}: {row['review_count']} reviews, {row['avg_rating']:.2f} avg rating")
         
         # Review distribution per product
-        product_stats = pd.read_sql_query('''
-            SELECT 
-                COUNT(*) as product_count,
-                AVG(review_count) as avg_reviews_per_product,
-                MAX(review_count) as max_reviews
-            FROM (
-                SELECT asin, COUNT(*) as review_count
-                FROM reviews
-                GROUP BY asin
-            )
-        ''', self.conn)
+        product_stats = self._frame(queries.product_review_stats, **filters)
         
         print(f"\nProduct Review Statistics:")
         print(f"   Average reviews per product: {product_stats.iloc[0]['avg_reviews_per_product']:.1f}")
@@ -123,24 +107,13 @@ class AmazonEDA:
         
         return top_products, product_stats
     
-    def reviewer_analysis(self):
+    def reviewer_analysis(self, **filters):
         """Analyze reviewer behavior"""
         print("\n👥 REVIEWER ANALYSIS")
-        print="="*60)
+        print("="*60)
         
         # Most active reviewers
-        top_reviewers = pd.read_sql_query('''
-            SELECT 
-                reviewerID,
-                COUNT(*) as review_count,
-                AVG(overall) as avg_rating,
-                MIN(unixReviewTime) as first_review,
-                MAX(unixReviewTime) as last_review
-            FROM reviews
-            GROUP BY reviewerID
-            ORDER BY review_count DESC
-            LIMIT 10
-        ''', self.conn)
+        top_reviewers = self._frame(queries.top_reviewers, limit=10, **filters)
         
         print("Top 10 Most Active Reviewers:")
         for i, (_, row) in enumerate(top_reviewers.iterrows(), 1):
@@ -149,17 +122,7 @@ class AmazonEDA:
                   f"{row['avg_rating']:.2f} avg, {days_active:.0f} days active")
         
         # Reviewer engagement distribution
-        reviewer_stats = pd.read_sql_query('''
-            SELECT 
-                COUNT(*) as reviewer_count,
-                AVG(review_count) as avg_reviews,
-                MAX(review_count) as max_reviews
-            FROM (
-                SELECT reviewerID, COUNT(*) as review_count
-                FROM reviews
-                GROUP BY reviewerID
-            )
-        ''', self.conn)
+        reviewer_stats = self._frame(queries.reviewer_engagement, **filters)
         
         print(f"\nReviewer Engagement:")
         print(f"   Average reviews per reviewer: {reviewer_stats.iloc[0]['avg_reviews']:.1f}")
@@ -167,23 +130,12 @@ class AmazonEDA:
         
         return top_reviewers, reviewer_stats
     
-    def category_analysis(self):
+    def category_analysis(self, **filters):
         """Analyze differences between categories"""
         print("\n📚 CATEGORY ANALYSIS")
-        print="="*60)
+        print("="*60)
         
-        category_stats = pd.read_sql_query('''
-            SELECT 
-                category,
-                COUNT(*) as review_count,
-                COUNT(DISTINCT asin) as product_count,
-                COUNT(DISTINCT reviewerID) as reviewer_count,
-                AVG(overall) as avg_rating,
-                AVG(LENGTH(reviewText)) as avg_review_length
-            FROM reviews
-            GROUP BY category
-            ORDER BY review_count DESC
-        ''', self.conn)
+        category_stats = self._frame(queries.category_stats, **filters)
         
         print("Category Performance:")
         for _, row in category_stats.iterrows():
@@ -192,23 +144,13 @@ class AmazonEDA:
         
         return category_stats
     
-    def helpfulness_analysis(self):
+    def helpfulness_analysis(self, **filters):
         """Analyze review helpfulness"""
         print("\n👍 HELPFULNESS ANALYSIS")
-        print="="*60)
+        print("="*60)
         
-        helpful_stats = pd.read_sql_query('''
-            SELECT 
-                CASE 
-                    WHEN helpful > 0 THEN 'Helpful'
-                    ELSE 'Not Helpful'
-                END as helpfulness,
-                COUNT(*) as review_count,
-                AVG(overall) as avg_rating,
-                AVG(LENGTH(reviewText)) as avg_length
-            FROM reviews
-            GROUP BY helpfulness
-        ''', self.conn)
+        helpfulness = queries.helpfulness(self.conn, **filters)
+        helpful_stats = pd.DataFrame(helpfulness['groups'], columns=helpfulness['groups'].columns)
         
         print("Helpful vs Not Helpful Reviews:")
         for _, row in helpful_stats.iterrows():
@@ -216,14 +158,7 @@ class AmazonEDA:
                   f"{row['avg_rating']:.2f} avg rating, {row['avg_length']:.0f} chars")
         
         # Correlation between rating and helpfulness
-        correlation = pd.read_sql_query('''
-            SELECT 
-                overall as rating,
-                AVG(helpful) as avg_helpful_votes
-            FROM reviews
-            GROUP BY overall
-            ORDER BY overall
-        ''', self.conn)
+        correlation = pd.DataFrame(helpfulness['by_rating'], columns=helpfulness['by_rating'].columns)
         
         print(f"\nHelpfulness by Rating:")
         for _, row in correlation.iterrows():
@@ -231,87 +166,246 @@ class AmazonEDA:
         
         return helpful_stats, correlation
     
-    def create_dashboard(self):
-        """Create comprehensive visualization dashboard"""
-        fig, axes = plt.subplots(2, 3, figsize=(18, 12))
-        fig.suptitle('Amazon Product Reviews Analysis Dashboard', fontsize=16, fontweight='bold')
+    def _group_codes(self, by):
+        """Per-row group codes and labels for by=None, 'category' or a numeric column"""
+        if by is None:
+            return np.zeros(len(self.columns.extract('overall', dtype='float32')), dtype=np.int64), [None]
+        if by == 'category':
+            codes, labels = self.columns.codes('category')
+            return np.asarray(codes, dtype=np.int64), labels
+        labels, codes = np.unique(self.columns.extract(by, dtype='float32'), return_inverse=True)
+        return codes, labels.tolist()
+    
+    def text_stat_histogram(self, bin_edges, column='review_length', by=None, category=None):
+        """Histogram of a text-statistics column over arbitrary bin edges
+        
+        Bins are [edge, next_edge); use np.inf as the last edge for an open-ended
+        bin. Computed with NumPy over memory-mapped column extracts, so review
+        text is never read. Returns one row per bin (per group when by is
+        'category' or a numeric column such as 'overall') with count and
+        avg_rating.
+        """
+        edges = np.asarray(bin_edges, dtype=float)
+        n_bins = len(edges) - 1
+        values = self.columns.extract(column)
+        ratings = self.columns.extract('overall', dtype='float32')
+        groups, group_labels = self._group_codes(by)
+        
+        bins = np.searchsorted(edges, values, side='right') - 1
+        valid = (values >= 0) & (bins >= 0) & (bins < n_bins) & (groups >= 0)
+        if category is not None:
+            codes, labels = self.columns.codes('category')
+            valid &= np.asarray(codes) == (labels.index(category) if category in labels else -2)
+        
+        flat = groups * n_bins + bins
+        size = len(group_labels) * n_bins
+        counts = np.bincount(flat[valid], minlength=size)
+        # Unrated reviews (NULL overall, extracted as -1) count but stay out of avg_rating
+        rated = valid & (ratings >= 0)
+        rated_counts = np.bincount(flat[rated], minlength=size)
+        rating_sums = np.bincount(flat[rated], weights=ratings[rated], minlength=size)
+        
+        histogram = pd.DataFrame({
+            'bin': [_bin_label(left, right) for left, right in zip(edges[:-1], edges[1:])] * len(group_labels),
+            'left': np.tile(edges[:-1], len(group_labels)),
+            'right': np.tile(edges[1:], len(group_labels)),
+            'count': counts,
+            'avg_rating': np.divide(rating_sums, rated_counts, out=np.full(size, np.nan), where=rated_counts > 0),
+        })
+        if by is not None:
+            histogram.insert(0, by, np.repeat(group_labels, n_bins))
+        return histogram
+    
+    def text_stat_quantiles(self, quantiles=(0.1, 0.25, 0.5, 0.75, 0.9, 0.99), column='review_length', by=None):
+        """Quantiles of a text-statistics column, overall or per group, from memory-mapped extracts"""
+        values = self.columns.extract(column)
+        groups, group_labels = self._group_codes(by)
+        valid = (values >= 0) & (groups >= 0)
+        
+        rows = {}
+        for code, label in enumerate(group_labels):
+            group_values = values[valid & (groups == code)]
+            if len(group_values):
+                rows[label if by is not None else column] = np.quantile(group_values, quantiles)
+        return pd.DataFrame.from_dict(rows, orient='index', columns=list(quantiles))
+    
+    @staticmethod
+    def _bad_query(query, error):
+        print(f"❌ Bad search query {query!r}: {error}")
+        print("💡 Use plain=True (amazon_cli search --plain) to match the words literally.")
+    
+    def _has_fts_index(self):
+        row = self.conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'reviews_fts'").fetchone()
+        if row is None:
+            print("❌ No full-text index. Run initialize_amazon_database(fts=True) first.")
+        return row is not None
+    
+    @staticmethod
+    def _fts_match(query, rating=None, category=None, plain=False):
+        """Build an FTS5 MATCH expression: query over text/summary plus index-only filters
+        
+        plain=True quotes every whitespace-separated token, so input such as
+        wi-fi, USB-C or don't is matched literally instead of parsed as FTS5 syntax.
+        """
+        if plain:
+            query = ' '.join('"' + token.replace('"', '""') + '"' for token in query.split())
+        expression = f"{{reviewText summary}} : ({query})"
+        if rating is not None:
+            expression += f' AND overall : ^"{int(rating)}"'
+        if category:
+            escaped = str(category).replace('"', '""')
+            expression += f' AND category : "{escaped}"'
+        return expression
+    
+    def search(self, query, rating=None, category=None, since=None, until=None, limit=20, plain=False):
+        """BM25-ranked full-text search over review text and summary
+        
+        query uses FTS5 syntax (e.g. 'battery', '"broke after"', 'refund OR return'),
+        or plain words with plain=True. A query FTS5 cannot parse prints an
+        error and returns (None, None).
+        Returns (hits, facets): the top `limit` hits, and hit counts by rating,
+        category and year over all matches.
+        """
+        if not self._has_fts_index():
+            return None, None
+        
+        match = self._fts_match(query, rating, category, plain)
+        time_filter, params = "", [match]
+        since, until = queries.unix_time(since), queries.unix_time(until)
+        if since is not None:
+            time_filter += " AND r.unixReviewTime >= ?"
+            params.append(since)
+        if until is not None:
+            time_filter += " AND r.unixReviewTime < ?"
+            params.append(until)
+        
+        try:
+            hits = pd.read_sql_query(f'''
+                SELECT 
+                    r.asin,
+                    r.reviewerID,
+                    r.overall as rating,
+                    r.category,
+                    r.unixReviewTime,
+                    r.summary,
+                    snippet(reviews_fts, 0, '[', ']', '...', 16) as snippet,
+                    bm25(reviews_fts, 1.0, 2.0, 0.0, 0.0) as score
+                FROM reviews_fts
+                JOIN reviews r ON r.rowid = reviews_fts.rowid
+                WHERE reviews_fts MATCH ? {time_filter}
+                ORDER BY score
+                LIMIT ?
+            ''', self.conn, params=params + [limit])
+        except (sqlite3.Error, pd.errors.DatabaseError) as e:
+            # The facets reuse the same MATCH, so only this first query can fail to parse
+            self._bad_query(query, e)
+            return None, None
+        
+        matches = f'''
+            SELECT r.overall, r.category, r.unixReviewTime
+            FROM reviews_fts
+            JOIN reviews r ON r.rowid = reviews_fts.rowid
+            WHERE reviews_fts MATCH ? {time_filter}
+        '''
+        facets = {
+            'rating': pd.read_sql_query(f'''
+                SELECT overall as rating, COUNT(*) as hits FROM ({matches})
+                GROUP BY overall ORDER BY overall
+            ''', self.conn, params=params),
+            'category': pd.read_sql_query(f'''
+                SELECT category, COUNT(*) as hits FROM ({matches})
+                GROUP BY category ORDER BY hits DESC
+            ''', self.conn, params=params),
+            'year': pd.read_sql_query(f'''
+                SELECT strftime('%Y', datetime(unixReviewTime, 'unixepoch')) as year, COUNT(*) as hits
+                FROM ({matches})
+                GROUP BY year ORDER BY year
+            ''', self.conn, params=params),
+        }
+
+        print(f"🔎 {int(facets['rating']['hits'].sum()):,} reviews match {query!r}")
+        return hits, facets
+    
+    def term_frequency_by_rating(self, terms, category=None, plain=False):
+        """Number of reviews containing each term, per star rating
+        
+        Answered from the full-text index alone (rating is an indexed column),
+        so the reviews table is never read. Returns a DataFrame indexed by
+        rating with one column per term, or None if a term cannot be parsed.
+        """
+        if not self._has_fts_index():
+            return None
+        
+        counts = {}
+        for term in terms:
+            counts[term] = {}
+            for rating in range(1, 6):
+                match = self._fts_match(term, rating, category, plain)
+                try:
+                    counts[term][rating] = self.conn.execute(
+                        "SELECT COUNT(*) FROM reviews_fts WHERE reviews_fts MATCH ?", (match,)
+                    ).fetchone()[0]
+                except sqlite3.Error as e:
+                    self._bad_query(term, e)
+                    return None
+        
+        frequencies = pd.DataFrame(counts)
+        frequencies.index.name = 'rating'
+        return frequencies
+    
+    def dashboard_aggregates(self, category=None):
+        """Run the dashboard queries, optionally restricted to one category"""
+        where = "WHERE category = ?" if category else ""
+        params = (category,) if category else ()
+        
+        aggregates = {}
         
         # 1. Rating Distribution
-        rating_data = pd.read_sql_query('''
+        aggregates['rating'] = pd.read_sql_query(f'''
             SELECT overall, COUNT(*) as count
             FROM reviews
+            {where}
             GROUP BY overall
             ORDER BY overall
-        ''', self.conn)
-        
-        axes[0,0].bar(rating_data['overall'], rating_data['count'], color='skyblue', alpha=0.7)
-        axes[0,0].set_title('Rating Distribution', fontweight='bold')
-        axes[0,0].set_xlabel('Star Rating')
-        axes[0,0].set_ylabel('Number of Reviews')
+        ''', self.conn, params=params)
         
         # 2. Reviews Over Time
-        time_data = pd.read_sql_query('''
+        aggregates['time'] = pd.read_sql_query(f'''
             SELECT 
                 strftime('%Y-%m', datetime(unixReviewTime, 'unixepoch')) as month,
                 COUNT(*) as review_count
             FROM reviews
+            {where}
             GROUP BY month
             ORDER BY month
-        ''', self.conn)
-        
-        axes[0,1].plot(time_data['month'], time_data['review_count'], marker='o', linewidth=2)
-        axes[0,1].set_title('Reviews Over Time', fontweight='bold')
-        axes[0,1].set_xlabel('Month')
-        axes[0,1].set_ylabel('Number of Reviews')
-        axes[0,1].tick_params(axis='x', rotation=45)
+        ''', self.conn, params=params)
         
         # 3. Category Distribution
-        category_data = pd.read_sql_query('''
+        aggregates['category'] = pd.read_sql_query(f'''
             SELECT category, COUNT(*) as review_count
             FROM reviews
+            {where}
             GROUP BY category
             ORDER BY review_count DESC
-        ''', self.conn)
-        
-        axes[0,2].pie(category_data['review_count'], labels=category_data['category'], autopct='%1.1f%%')
-        axes[0,2].set_title('Reviews by Category', fontweight='bold')
+        ''', self.conn, params=params)
         
         # 4. Review Length Distribution
-        length_data = pd.read_sql_query('''
-            SELECT 
-                CASE 
-                    WHEN LENGTH(reviewText) < 50 THEN '0-50'
-                    WHEN LENGTH(reviewText) < 200 THEN '50-200'
-                    WHEN LENGTH(reviewText) < 500 THEN '200-500'
-                    ELSE '500+'
-                END as length_group,
-                COUNT(*) as count,
-                AVG(overall) as avg_rating
-            FROM reviews
-            WHERE reviewText IS NOT NULL
-            GROUP BY length_group
-        ''', self.conn)
-        
-        axes[1,0].bar(length_data['length_group'], length_data['count'], color='lightgreen')
-        axes[1,0].set_title('Review Length Distribution', fontweight='bold')
-        axes[1,0].set_xlabel('Review Length (chars)')
-        axes[1,0].set_ylabel('Number of Reviews')
+        length_data = self.text_stat_histogram(LENGTH_BUCKETS, category=category)
+        aggregates['length'] = length_data.rename(columns={'bin': 'length_group'})[
+            ['length_group', 'count', 'avg_rating']
+        ]
         
         # 5. Helpfulness vs Rating
-        helpful_data = pd.read_sql_query('''
+        aggregates['helpful'] = pd.read_sql_query(f'''
             SELECT overall, AVG(helpful) as avg_helpful
             FROM reviews
+            {where}
             GROUP BY overall
             ORDER BY overall
-        ''', self.conn)
-        
-        axes[1,1].plot(helpful_data['overall'], helpful_data['avg_helpful'], marker='s', color='coral')
-        axes[1,1].set_title('Helpfulness vs Rating', fontweight='bold')
-        axes[1,1].set_xlabel('Star Rating')
-        axes[1,1].set_ylabel('Average Helpful Votes')
+        ''', self.conn, params=params)
         
         # 6. Reviewer Activity
-        reviewer_data = pd.read_sql_query('''
+        aggregates['reviewer'] = pd.read_sql_query(f'''
             SELECT 
                 CASE 
                     WHEN review_count = 1 THEN '1'
@@ -323,20 +417,111 @@ class AmazonEDA:
             FROM (
                 SELECT reviewerID, COUNT(*) as review_count
                 FROM reviews
+                {where}
                 GROUP BY reviewerID
             )
             GROUP BY activity_level
-        ''', self.conn)
+        ''', self.conn, params=params)
         
-        axes[1,2].pie(reviewer_data['reviewer_count'], labels=reviewer_data['activity_level'], autopct='%1.1f%%')
-        axes[1,2].set_title('Reviewer Activity Levels', fontweight='bold')
-        
-        plt.tight_layout()
-        plt.savefig('amazon_analysis_dashboard.png', dpi=300, bbox_inches='tight')
-        plt.show()
+        return aggregates
+    
+    def create_dashboard(self, output_path='amazon_analysis_dashboard.png', fmt='png', dpi=300,
+                         headless=False, force=False):
+        """Create comprehensive visualization dashboard
+        
+        headless forces the Agg backend and skips plt.show(). The render is skipped
+        when the aggregates (and fmt/dpi) hash the same as the last saved file.
+        """
+        if headless:
+            use_headless_backend()
+        
+        aggregates = self.dashboard_aggregates()
+        output_path = with_format(output_path, fmt)
+        digest = aggregates_hash(aggregates, dpi=dpi, title=DASHBOARD_TITLE)
+        if not force and is_fresh(output_path, digest):
+            print(f"⏭️ Dashboard unchanged, skipping render: {output_path}")
+            return output_path
+        
+        plt = pyplot()
+        fig = draw_dashboard(aggregates)
+        save_figure(fig, output_path, dpi)
+        mark_fresh(output_path, digest)
+        if headless:
+            plt.close(fig)
+        else:
+            plt.show()
+        return output_path
+    
+    def render_category_dashboards(self, output_dir='dashboards', fmt='svg', dpi=100,
+                                   max_workers=None, force=False):
+        """Render one headless dashboard per category in a process pool
+        
+        Only categories whose aggregates changed since the last run are redrawn.
+        """
+        categories = pd.read_sql_query(
+            'SELECT DISTINCT category FROM reviews ORDER BY category', self.conn
+        )['category']
+        
+        jobs = []
+        for category in categories:
+            jobs.append({
+                'aggregates': self.dashboard_aggregates(category),
+                'output_path': os.path.join(output_dir, f'dashboard_{category}.{fmt}'),
+                'title': f'{DASHBOARD_TITLE} - {str(category).title()}',
+                'dpi': dpi,
+            })
+        
+        rendered, skipped = render_dashboards(jobs, max_workers=max_workers, force=force)
+        print(f"🖼️ Rendered {len(rendered)} category dashboards, {len(skipped)} unchanged")
+        return rendered, skipped
+    
+    def review_time_series(self, freq='day', asin=None, category=None):
+        """Review counts and average rating per day or month, optionally for one product/category"""
+        bucket = '%Y-%m-%d' if freq == 'day' else '%Y-%m'
+        conditions, params = [], []
+        if asin:
+            conditions.append("asin = ?")
+            params.append(asin)
+        if category:
+            conditions.append("category = ?")
+            params.append(category)
+        where = "WHERE " + " AND ".join(conditions) if conditions else ""
+        
+        series = pd.read_sql_query(f'''
+            SELECT 
+                strftime('{bucket}', datetime(unixReviewTime, 'unixepoch')) as period,
+                COUNT(*) as review_count,
+                AVG(overall) as avg_rating
+            FROM reviews
+            {where}
+            GROUP BY period
+            ORDER BY period
+        ''', self.conn, params=params)
+        series['period'] = pd.to_datetime(series['period'])
+        return series
+    
+    def plot_review_series(self, output_path='review_series.png', freq='day', asin=None, category=None,
+                           max_points=1000, dpi=150, headless=False):
+        """Plot review volume over time, LTTB-downsampled to at most max_points points"""
+        if headless:
+            use_headless_backend()
+        
+        series = self.review_time_series(freq, asin=asin, category=category)
+        plt = pyplot()
+        fig, ax = plt.subplots(figsize=(12, 5))
+        plot_time_series(ax, series['period'], series['review_count'], threshold=max_points, linewidth=1)
+        label = asin or category or 'All Reviews'
+        ax.set_title(f'Reviews per {freq.title()} - {label}', fontweight='bold')
+        ax.set_ylabel('Number of Reviews')
+        save_figure(fig, output_path, dpi)
+        if headless:
+            plt.close(fig)
+        else:
+            plt.show()
+        return output_path
     
-    def generate_report(self):
-        """Generate comprehensive analysis report"""
+    def generate_report(self, dashboard=True):
+        """Generate comprehensive analysis report (set dashboard=False for text only)"""
         print("\n" + "="*60)
         print("📊 AMAZON REVIEWS ANALYSIS REPORT")
         print("="*60)
@@ -374,7 +559,8 @@ class AmazonEDA:
         print(f"• {best_category} has the most reviews")
         print(f"• {best_rating['category']} has the highest average rating ({best_rating['avg_rating']:.2f})")
         
-        self.create_dashboard()
+        if dashboard:
+            self.create_dashboard()
         self.conn.close()
 
 if __name__ == "__main__":
@@ -0,0 +1,113 @@
+import glob
+import hashlib
+import json
+import os
+import tempfile
+
+import numpy as np
+
+
+class ColumnStore:
+    """Memory-mapped .npy extracts of single reviews columns
+
+    Each extract is written once (streamed from SQLite in chunks) and then
+    opened with np.load(mmap_mode='r'), so repeated histogram/quantile runs
+    touch only the pages they need and never read review text. Extracts are
+    keyed by the database path plus the table's row count, max rowid and the
+    file's nanosecond mtime and size, so a reload or incremental ingest
+    produces a fresh extract and two databases never share one. Extracts are
+    written to a unique temp file and renamed into place, so concurrent
+    processes can build the same one safely.
+    """
+
+    def __init__(self, conn, db_path, cache_dir='.column_cache', chunksize=1_000_000):
+        self.conn = conn
+        self.db_path = db_path
+        self.cache_dir = cache_dir
+        self.chunksize = chunksize
+        self.db_key = hashlib.sha256(os.path.abspath(db_path).encode()).hexdigest()[:12]
+
+    def data_version(self):
+        """Cheap fingerprint of the reviews table contents"""
+        count, max_rowid = self.conn.execute("SELECT COUNT(*), MAX(rowid) FROM reviews").fetchone()
+        stat = os.stat(self.db_path) if os.path.exists(self.db_path) else None
+        file_version = f"{stat.st_mtime_ns}-{stat.st_size}" if stat else "0-0"
+        return f"{count}-{max_rowid or 0}-{file_version}"
+
+    def _path(self, name):
+        return os.path.join(self.cache_dir, f"{name}-{self.db_key}-{self.data_version()}.npy")
+
+    def _prune(self, name, keep):
+        """Delete extracts of name for this database left over from older data versions"""
+        for stale in glob.glob(os.path.join(self.cache_dir, f"{name}-{self.db_key}-*")):
+            if not stale.startswith(keep.replace('.npy', '')):
+                try:
+                    os.remove(stale)
+                except OSError:
+                    pass  # already pruned by another process, or still mapped (Windows)
+
+    def _temp_path(self, suffix):
+        """Unique temp file in cache_dir; the leading dot keeps it out of _prune's glob"""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix='.tmp-', suffix=suffix, dir=self.cache_dir)
+        os.close(fd)
+        return tmp_path
+
+    @staticmethod
+    def _publish(tmp_path, path):
+        """Rename tmp_path into place; losing the race to an identical extract is fine"""
+        try:
+            os.replace(tmp_path, path)
+        except OSError:
+            os.remove(tmp_path)
+            if not os.path.exists(path):
+                raise
+
+    def _write(self, path, sql, dtype, params=()):
+        count = self.conn.execute("SELECT COUNT(*) FROM reviews").fetchone()[0]
+        tmp_path = self._temp_path('.npy')
+        try:
+            out = np.lib.format.open_memmap(tmp_path, mode='w+', dtype=dtype, shape=(count,))
+            cursor = self.conn.execute(sql, params)
+            offset = 0
+            while True:
+                rows = cursor.fetchmany(self.chunksize)
+                if not rows:
+                    break
+                out[offset:offset + len(rows)] = np.fromiter((row[0] for row in rows), dtype=dtype, count=len(rows))
+                offset += len(rows)
+            out.flush()
+            del out
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+        self._publish(tmp_path, path)
+
+    def extract(self, column, dtype='int32', missing=-1):
+        """Memory-mapped array of a numeric column in rowid order (NULL -> missing)"""
+        path = self._path(column)
+        if not os.path.exists(path):
+            self._prune(column, path)
+            self._write(path, f"SELECT COALESCE({column}, {missing}) FROM reviews ORDER BY rowid", dtype)
+        return np.load(path, mmap_mode='r')
+
+    def codes(self, column):
+        """Memory-mapped integer codes of a text column plus the list of labels"""
+        path = self._path(f"{column}_codes")
+        labels_path = path.replace('.npy', '.json')
+        if not os.path.exists(path):
+            labels = [row[0] for row in self.conn.execute(
+                f"SELECT DISTINCT {column} FROM reviews WHERE {column} IS NOT NULL ORDER BY {column}"
+            )]
+            cases = ' '.join(f"WHEN ? THEN {i}" for i in range(len(labels)))
+            sql = f"SELECT CASE {column} {cases} ELSE -1 END FROM reviews ORDER BY rowid"
+            self._prune(f"{column}_codes", path)
+            # Labels first, so a reader that sees the codes file always finds its labels
+            tmp_labels = self._temp_path('.json')
+            with open(tmp_labels, 'w') as f:
+                json.dump(labels, f)
+            self._publish(tmp_labels, labels_path)
+            self._write(path, sql, 'int16', labels)
+        with open(labels_path) as f:
+            labels = json.load(f)
+        return np.load(path, mmap_mode='r'), labels
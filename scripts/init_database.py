@@ -0,0 +1,268 @@
+import sqlite3
+import pandas as pd
+import os
+import glob
+import json
+
+FTS_COLUMNS = ['reviewText', 'summary', 'overall', 'category']
+
+
+def create_fts_index(conn, rebuild=True):
+    """Create the external-content FTS5 index over review text and summary
+    
+    overall and category are indexed too (with zero BM25 weight at query time)
+    so rating/category filters and per-rating term counts can be answered from
+    the index alone. Triggers keep the index in sync with inserts, updates and
+    deletes on reviews. Run with rebuild=True after the reviews table is
+    replaced or VACUUMed, since either can change its rowids.
+    """
+    columns = ', '.join(FTS_COLUMNS)
+    new_values = ', '.join(f'new.{col}' for col in FTS_COLUMNS)
+    old_values = ', '.join(f'old.{col}' for col in FTS_COLUMNS)
+    
+    cursor = conn.cursor()
+    cursor.execute(f'''
+        CREATE VIRTUAL TABLE IF NOT EXISTS reviews_fts
+        USING fts5({columns}, content='reviews', content_rowid='rowid')
+    ''')
+    cursor.executescript(f'''
+        CREATE TRIGGER IF NOT EXISTS reviews_fts_ai AFTER INSERT ON reviews BEGIN
+            INSERT INTO reviews_fts(rowid, {columns}) VALUES (new.rowid, {new_values});
+        END;
+        CREATE TRIGGER IF NOT EXISTS reviews_fts_ad AFTER DELETE ON reviews BEGIN
+            INSERT INTO reviews_fts(reviews_fts, rowid, {columns}) VALUES ('delete', old.rowid, {old_values});
+        END;
+        CREATE TRIGGER IF NOT EXISTS reviews_fts_au AFTER UPDATE OF {columns} ON reviews BEGIN
+            INSERT INTO reviews_fts(reviews_fts, rowid, {columns}) VALUES ('delete', old.rowid, {old_values});
+            INSERT INTO reviews_fts(rowid, {columns}) VALUES (new.rowid, {new_values});
+        END;
+    ''')
+    if rebuild:
+        cursor.execute("INSERT INTO reviews_fts(reviews_fts) VALUES ('rebuild')")
+    conn.commit()
+
+
+TEXT_STAT_COLUMNS = ['review_length', 'word_count', 'summary_length', 'non_ascii_permille']
+
+
+def add_text_statistics(df):
+    """Add integer text-statistics columns so analyses never re-read review text
+    
+    review_length/summary_length are character counts, word_count counts
+    whitespace-separated tokens and non_ascii_permille is the share of
+    non-ASCII characters in reviewText (0-1000). Missing text stays NULL.
+    """
+    has_text = df['reviewText'].notna()
+    text = df['reviewText'].fillna('').astype(str)
+    summary = df['summary'].fillna('').astype(str)
+    
+    length = text.str.len()
+    df['review_length'] = length.where(has_text).astype('Int64')
+    df['word_count'] = text.str.count(r'\S+').where(has_text).astype('Int64')
+    df['summary_length'] = summary.str.len().where(df['summary'].notna()).astype('Int64')
+    non_ascii = text.str.count(r'[^\x00-\x7f]')
+    df['non_ascii_permille'] = (non_ascii * 1000 // length.clip(lower=1)).where(has_text).astype('Int64')
+    return df
+
+
+def ensure_text_statistics(conn, chunksize=100_000):
+    """Add and backfill the text-statistics columns on a reviews table loaded before they existed"""
+    existing = {row[1] for row in conn.execute("PRAGMA table_info(reviews)")}
+    missing = [col for col in TEXT_STAT_COLUMNS if col not in existing]
+    if not missing:
+        return
+    
+    print("🧮 Backfilling text statistics...")
+    for col in missing:
+        conn.execute(f"ALTER TABLE reviews ADD COLUMN {col} INTEGER")
+    
+    assignments = ', '.join(f'{col} = ?' for col in TEXT_STAT_COLUMNS)
+    query = "SELECT rowid, reviewText, summary FROM reviews"
+    for chunk in pd.read_sql_query(query, conn, chunksize=chunksize):
+        stats = add_text_statistics(chunk)[TEXT_STAT_COLUMNS + ['rowid']]
+        rows = stats.astype(object).where(stats.notna(), None).itertuples(index=False)
+        conn.executemany(f"UPDATE reviews SET {assignments} WHERE rowid = ?", rows)
+    conn.commit()
+
+
+def table_exists(conn, name):
+    """True if a table (or virtual table) called name exists"""
+    row = conn.execute("SELECT 1 FROM sqlite_master WHERE name = ?", (name,)).fetchone()
+    return row is not None
+
+
+def append_new_reviews(conn, reviews_df):
+    """Append only reviews not already loaded (same reviewerID and asin); returns rows added"""
+    reviews_df.to_sql('reviews_staging', conn, if_exists='replace', index=False)
+    columns = ', '.join(f'"{col}"' for col in reviews_df.columns)
+    cursor = conn.execute(f'''
+        INSERT INTO reviews ({columns})
+        SELECT {columns} FROM reviews_staging s
+        WHERE NOT EXISTS (
+            SELECT 1 FROM reviews r
+            WHERE r.reviewerID = s.reviewerID AND r.asin = s.asin
+        )
+    ''')
+    added = cursor.rowcount
+    conn.execute("DROP TABLE reviews_staging")
+    conn.commit()
+    return added
+
+
+def initialize_amazon_database(fts=False, incremental=False, db_path='amazon_reviews.db'):
+    """Initialize SQLite database with Amazon data
+    
+    fts=True builds a full-text index over reviewText/summary (see create_fts_index).
+    incremental=True appends only new reviews instead of replacing the table; an
+    existing full-text index is kept in sync by its triggers.
+    """
+    
+    # Check for data files
+    review_files = glob.glob('data/amazon_reviews_*.csv')
+    product_files = glob.glob('data/amazon_products_*.csv')
+    
+    if not review_files:
+        print("❌ No review data found! Run download_amazon.py first.")
+        return False
+    
+    print("📊 Initializing Amazon Database...")
+    
+    # Create database
+    conn = sqlite3.connect(db_path)
+    
+    # Load reviews data
+    all_reviews = []
+    for file in review_files:
+        category = file.split('_')[-1].replace('.csv', '')
+        print(f"Loading {category} reviews...")
+        
+        df = pd.read_csv(file)
+        df['category'] = category
+        all_reviews.append(df)
+    
+    # Combine all reviews
+    reviews_df = add_text_statistics(pd.concat(all_reviews, ignore_index=True))
+    replaced = not (incremental and table_exists(conn, 'reviews'))
+    if not replaced:
+        ensure_text_statistics(conn)
+        added = append_new_reviews(conn, reviews_df)
+        print(f"✅ Added {added:,} new reviews")
+    else:
+        reviews_df.to_sql('reviews', conn, if_exists='replace', index=False)
+        print(f"✅ Loaded {len(reviews_df):,} total reviews")
+    
+    # Load product data if available
+    if product_files:
+        all_products = []
+        for file in product_files:
+            category = file.split('_')[-1].replace('.csv', '')
+            print(f"Loading {category} products...")
+            
+            df = pd.read_csv(file)
+            df['category'] = category
+            all_products.append(df)
+        
+        products_df = pd.concat(all_products, ignore_index=True)
+        products_df.to_sql('products', conn, if_exists='replace', index=False)
+        print(f"✅ Loaded {len(products_df):,} products")
+    
+    # Create indexes
+    cursor = conn.cursor()
+    indexes = [
+        "CREATE INDEX IF NOT EXISTS idx_reviews_asin ON reviews(asin);",
+        "CREATE INDEX IF NOT EXISTS idx_reviews_overall ON reviews(overall);",
+        "CREATE INDEX IF NOT EXISTS idx_reviews_category ON reviews(category);",
+        "CREATE INDEX IF NOT EXISTS idx_reviews_reviewer_asin ON reviews(reviewerID, asin);",
+        "CREATE INDEX IF NOT EXISTS idx_products_asin ON products(asin);"
+    ]
+    
+    for index_sql in indexes:
+        try:
+            cursor.execute(index_sql)
+        except Exception as e:
+            print(f"Index error: {e}")
+    
+    conn.commit()
+    
+    # Full-text index: a replaced reviews table loses its triggers, so rebuild
+    if fts or table_exists(conn, 'reviews_fts'):
+        fts_existed = table_exists(conn, 'reviews_fts')
+        print("🔎 Updating full-text index...")
+        create_fts_index(conn, rebuild=replaced or not fts_existed)
+    
+    # Display database stats
+    print("\n📋 Database Summary:")
+    tables = ['reviews', 'products']
+    for table in tables:
+        try:
+            count = pd.read_sql_query(f"SELECT COUNT(*) as count FROM {table}", conn).iloc[0,0]
+            print(f"   {table}: {count:,} records")
+        except:
+            print(f"   {table}: not found")
+    
+    # Sample data preview
+    print("\n🔍 Sample Review Data:")
+    sample = pd.read_sql_query("SELECT * FROM reviews LIMIT 3", conn)
+    print(sample[['asin', 'overall', 'category', 'reviewText']].head(3))
+    
+    conn.close()
+    return True
+
+def explore_data_quality():
+    """Explore data quality and basic statistics"""
+    
+    conn = sqlite3.connect('amazon_reviews.db')
+    
+    print("\n📈 Data Quality Report:")
+    print("="*50)
+    
+    # Review statistics
+    review_stats = pd.read_sql_query('''
+        SELECT 
+            COUNT(*) as total_reviews,
+            COUNT(DISTINCT asin) as unique_products,
+            COUNT(DISTINCT reviewerID) as unique_reviewers,
+            AVG(overall) as avg_rating,
+            MIN(overall) as min_rating,
+            MAX(overall) as max_rating
+        FROM reviews
+    ''', conn)
+    
+    print("Review Statistics:")
+    for col in review_stats.columns:
+        print(f"   {col}: {review_stats.iloc[0][col]}")
+    
+    # Rating distribution
+    rating_dist = pd.read_sql_query('''
+        SELECT 
+            overall as rating,
+            COUNT(*) as count,
+            ROUND(COUNT(*) * 100.0 / (SELECT COUNT(*) FROM reviews), 2) as percentage
+        FROM reviews
+        GROUP BY overall
+        ORDER BY overall
+    ''', conn)
+    
+    print("\nRating Distribution:")
+    print(rating_dist.to_string(index=False))
+    
+    # Category distribution
+    category_dist = pd.read_sql_query('''
+        SELECT 
+            category,
+            COUNT(*) as review_count,
+            COUNT(DISTINCT asin) as product_count,
+            AVG(overall) as avg_rating
+        FROM reviews
+        GROUP BY category
+        ORDER BY review_count DESC
+    ''', conn)
+    
+    print("\nCategory Distribution:")
+    print(category_dist.to_string(index=False))
+    
+    conn.close()
+
+if __name__ == "__main__":
+    if initialize_amazon_database():
+        explore_data_quality()
\ No newline at end of file
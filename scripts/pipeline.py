@@ -0,0 +1,183 @@
+import glob
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from datetime import datetime
+
+
+class Stage:
+    """One pipeline step: a picklable function plus the files it reads and writes
+
+    inputs and outputs are paths or glob patterns. A stage depends on every
+    other stage that lists one of its inputs among its outputs. A function
+    that returns False is treated as a failure. always=True runs the stage on
+    every run (e.g. a download that checks the remote itself); stages after
+    it still skip when the files it writes are byte-identical.
+    """
+
+    def __init__(self, name, func, inputs=(), outputs=(), always=False):
+        self.name = name
+        self.func = func
+        self.inputs = list(inputs)
+        self.outputs = list(outputs)
+        self.always = always
+
+
+def _expand(patterns):
+    """Expand paths/glob patterns to a sorted list of existing files"""
+    paths = set()
+    for pattern in patterns:
+        paths.update(p for p in glob.glob(pattern) if os.path.isfile(p))
+    return sorted(paths)
+
+
+def _run_stage(func):
+    """Run a stage function in a worker process and time it"""
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+class Pipeline:
+    """Dependency-aware runner that skips stages whose inputs have not changed
+
+    Stage fingerprints (a content hash of every input file) are kept in
+    state_path; each run writes per-stage timings to manifest_path.
+    """
+
+    def __init__(self, stages, state_path='.pipeline_state.json',
+                 manifest_path='pipeline_manifest.json', max_workers=None):
+        self.stages = list(stages)
+        self.state_path = state_path
+        self.manifest_path = manifest_path
+        self.max_workers = max_workers
+        self.state = self._load_state()
+
+    def _load_state(self):
+        if os.path.exists(self.state_path):
+            with open(self.state_path) as f:
+                return json.load(f)
+        return {'stages': {}, 'files': {}}
+
+    def _save_state(self):
+        with open(self.state_path, 'w') as f:
+            json.dump(self.state, f, indent=2)
+
+    def dependencies(self, stage):
+        """Names of the stages that produce one of this stage's inputs"""
+        return {
+            other.name for other in self.stages
+            if other is not stage and set(other.outputs) & set(stage.inputs)
+        }
+
+    def file_hash(self, path):
+        """sha256 of a file, reusing the stored hash while size and mtime are unchanged"""
+        stat = os.stat(path)
+        cached = self.state['files'].get(path)
+        if cached and cached['size'] == stat.st_size and cached['mtime_ns'] == stat.st_mtime_ns:
+            return cached['sha256']
+
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+        self.state['files'][path] = {
+            'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'sha256': digest.hexdigest()
+        }
+        return digest.hexdigest()
+
+    def fingerprint(self, stage):
+        """Content hash over the stage name and all of its input files"""
+        digest = hashlib.sha256(stage.name.encode())
+        for path in _expand(stage.inputs):
+            digest.update(path.encode())
+            digest.update(self.file_hash(path).encode())
+        return digest.hexdigest()
+
+    def is_current(self, stage, fingerprint):
+        """True when the stage last ran on identical inputs and its outputs still exist
+
+        Source stages (no inputs) are current whenever their outputs exist,
+        unless they are marked always.
+        """
+        if stage.always:
+            return False
+        outputs_exist = all(glob.glob(pattern) for pattern in stage.outputs)
+        if not stage.inputs:
+            return outputs_exist
+        return self.state['stages'].get(stage.name) == fingerprint and outputs_exist
+
+    def run(self, force=()):
+        """Run every stage whose inputs changed, in parallel where dependencies allow"""
+        force = set(force)
+        manifest = {'started': datetime.now().isoformat(timespec='seconds'), 'stages': {}}
+        run_start = time.perf_counter()
+        pending = list(self.stages)
+        done, failed = set(), set()
+        running = {}
+
+        with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+            while pending or running:
+                scheduled = True
+                while scheduled:
+                    scheduled = False
+                    for stage in list(pending):
+                        deps = self.dependencies(stage)
+                        if deps & failed:
+                            print(f"⛔ {stage.name}: blocked by failed stage(s) {', '.join(sorted(deps & failed))}")
+                            manifest['stages'][stage.name] = {'status': 'blocked', 'seconds': 0.0}
+                            failed.add(stage.name)
+                        elif deps <= done:
+                            fingerprint = self.fingerprint(stage)
+                            if stage.name not in force and self.is_current(stage, fingerprint):
+                                print(f"⏭️ {stage.name}: inputs unchanged, skipping")
+                                manifest['stages'][stage.name] = {'status': 'skipped', 'seconds': 0.0}
+                                done.add(stage.name)
+                            else:
+                                print(f"▶️ {stage.name}: running")
+                                running[pool.submit(_run_stage, stage.func)] = (stage, fingerprint)
+                        else:
+                            continue
+                        pending.remove(stage)
+                        scheduled = True
+
+                if not running:
+                    # Nothing can start and nothing will finish: a dependency cycle
+                    for stage in pending:
+                        print(f"⛔ {stage.name}: blocked by a dependency cycle")
+                        manifest['stages'][stage.name] = {'status': 'blocked', 'seconds': 0.0}
+                        failed.add(stage.name)
+                    pending.clear()
+                    continue
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    stage, fingerprint = running.pop(future)
+                    try:
+                        result, seconds = future.result()
+                        error = None
+                    except Exception as e:
+                        result, seconds, error = False, 0.0, str(e)
+
+                    missing = [p for p in stage.outputs if not glob.glob(p)]
+                    if result is False or missing:
+                        print(f"❌ {stage.name}: failed{f' ({error})' if error else ''}")
+                        manifest['stages'][stage.name] = {
+                            'status': 'failed', 'seconds': round(seconds, 3),
+                            'error': error, 'missing_outputs': missing,
+                        }
+                        failed.add(stage.name)
+                    else:
+                        print(f"✅ {stage.name}: done in {seconds:.1f}s")
+                        manifest['stages'][stage.name] = {'status': 'ran', 'seconds': round(seconds, 3)}
+                        self.state['stages'][stage.name] = fingerprint
+                        done.add(stage.name)
+
+        manifest['total_seconds'] = round(time.perf_counter() - run_start, 3)
+        self._save_state()
+        with open(self.manifest_path, 'w') as f:
+            json.dump(manifest, f, indent=2)
+
+        return not failed
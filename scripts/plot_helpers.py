@@ -0,0 +1,113 @@
+import numpy as np
+import pandas as pd
+
+
+def lttb(x, y, threshold):
+    """Largest-Triangle-Three-Buckets downsampling
+
+    Keeps the first and last points and, for each of threshold-2 buckets in
+    between, the point forming the largest triangle with the previously kept
+    point and the average of the next bucket. Returns the kept indices.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    kept = np.empty(threshold, dtype=np.int64)
+    kept[0], kept[-1] = 0, n - 1
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+
+    a = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a])
+                      - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(np.argmax(area))
+        kept[i + 1] = a
+
+    return kept
+
+
+def downsample_series(dates, values, threshold=1000):
+    """LTTB-downsample a time series; returns (DatetimeIndex, ndarray) with at most threshold points"""
+    dates = pd.DatetimeIndex(pd.to_datetime(dates))
+    values = np.asarray(values, dtype=float)
+    kept = lttb(dates.asi8, values, threshold)
+    return dates[kept], values[kept]
+
+
+def plot_time_series(ax, dates, values, threshold=1000, **plot_kwargs):
+    """Plot a (downsampled) series on a real datetime axis"""
+    import matplotlib.dates as mdates
+    dates, values = downsample_series(dates, values, threshold)
+    ax.plot(dates, values, **plot_kwargs)
+    locator = mdates.AutoDateLocator()
+    ax.xaxis.set_major_locator(locator)
+    ax.xaxis.set_major_formatter(mdates.ConciseDateFormatter(locator))
+    return ax
+
+
+def quantile_summary(df, by, value):
+    """Per-group count/mean/min/quartiles/max of value, enough to draw a box plot"""
+    grouped = df.groupby(by)[value]
+    summary = grouped.agg(['count', 'mean', 'min', 'max'])
+    quartiles = grouped.quantile([0.25, 0.5, 0.75]).unstack()
+    summary['q1'] = quartiles[0.25]
+    summary['med'] = quartiles[0.5]
+    summary['q3'] = quartiles[0.75]
+    return summary.reset_index()
+
+
+def histogram_summary(df, by, value, bins=50, value_range=None):
+    """Per-group histogram of value on shared bin edges, in long format (by, left, right, count)"""
+    values = df[value].to_numpy(dtype=float)
+    if value_range is None:
+        value_range = (np.nanmin(values), np.nanmax(values))
+    edges = np.histogram_bin_edges(values, bins=bins, range=value_range)
+
+    rows = []
+    for group, group_values in df.groupby(by)[value]:
+        counts, _ = np.histogram(group_values.to_numpy(dtype=float), bins=edges)
+        rows.append(pd.DataFrame({by: group, 'left': edges[:-1], 'right': edges[1:], 'count': counts}))
+    return pd.concat(rows, ignore_index=True)
+
+
+def summary_boxplot(ax, summary, by):
+    """Draw a box plot from a quantile_summary() frame instead of raw rows"""
+    stats = []
+    for _, row in summary.iterrows():
+        iqr = row['q3'] - row['q1']
+        stats.append({
+            'label': row[by],
+            'med': row['med'],
+            'q1': row['q1'],
+            'q3': row['q3'],
+            'mean': row['mean'],
+            'whislo': max(row['min'], row['q1'] - 1.5 * iqr),
+            'whishi': min(row['max'], row['q3'] + 1.5 * iqr),
+            'fliers': [],
+        })
+    ax.bxp(stats, showfliers=False, patch_artist=True)
+    return ax
+
+
+def histogram_violin(ax, hist, by, width=0.8):
+    """Draw mirrored violins from a histogram_summary() frame instead of raw rows"""
+    groups = list(dict.fromkeys(hist[by]))
+    for position, group in enumerate(groups, 1):
+        group_hist = hist[hist[by] == group]
+        counts = group_hist['count'].to_numpy(dtype=float)
+        if counts.max() == 0:
+            continue
+        half_width = counts / counts.max() * width / 2
+        centers = (group_hist['left'].to_numpy() + group_hist['right'].to_numpy()) / 2
+        ax.fill_betweenx(centers, position - half_width, position + half_width, alpha=0.6)
+    ax.set_xticks(range(1, len(groups) + 1))
+    ax.set_xticklabels(groups)
+    return ax
@@ -0,0 +1,217 @@
+"""Filterable aggregate queries returning plain rows (lists of dicts)
+
+The single home of the analysis SQL: AmazonEDA wraps these in DataFrames
+and the JSON query service serves them as-is. They use sqlite3 directly
+and never print, so the service runs without importing pandas. Every
+function accepts the review filters in FILTERS.
+"""
+from datetime import datetime, timezone
+
+FILTERS = ('category', 'asin', 'rating', 'since', 'until')
+
+
+def unix_time(value):
+    """Accept a unix timestamp (int or digit string) or an ISO date; dates without an offset are UTC
+
+    UTC matches the 'unixepoch' month/day buckets used in the SQL.
+    """
+    if value is None or isinstance(value, (int, float)):
+        return value
+    if str(value).isdigit():
+        return int(value)
+    moment = datetime.fromisoformat(str(value))
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return int(moment.timestamp())
+
+
+def where_clause(category=None, asin=None, rating=None, since=None, until=None, prefix='WHERE'):
+    """SQL condition and parameters for the standard review filters"""
+    conditions, params = [], []
+    if category:
+        conditions.append("category = ?")
+        params.append(category)
+    if asin:
+        conditions.append("asin = ?")
+        params.append(asin)
+    if rating is not None:
+        conditions.append("overall = ?")
+        params.append(rating)
+    if since is not None:
+        conditions.append("unixReviewTime >= ?")
+        params.append(unix_time(since))
+    if until is not None:
+        conditions.append("unixReviewTime < ?")
+        params.append(unix_time(until))
+    if not conditions:
+        return "", params
+    return f"{prefix} " + " AND ".join(conditions), params
+
+
+class Rows(list):
+    """List of row dicts that also keeps the column names, so empty results still have a shape"""
+
+    def __init__(self, records, columns):
+        super().__init__(records)
+        self.columns = columns
+
+
+def rows(conn, sql, params=()):
+    """Run sql and return a list of dicts keyed by column name"""
+    cursor = conn.execute(sql, params)
+    columns = [col[0] for col in cursor.description]
+    return Rows((dict(zip(columns, row)) for row in cursor.fetchall()), columns)
+
+
+def overview(conn, **filters):
+    where, params = where_clause(**filters)
+    return rows(conn, f'''
+        SELECT
+            COUNT(*) as total_reviews,
+            COUNT(DISTINCT asin) as unique_products,
+            COUNT(DISTINCT reviewerID) as unique_reviewers,
+            AVG(overall) as avg_rating,
+            MIN(unixReviewTime) as first_review,
+            MAX(unixReviewTime) as last_review
+        FROM reviews
+        {where}
+    ''', params)[0]
+
+
+def rating_distribution(conn, **filters):
+    where, params = where_clause(**filters)
+    return rows(conn, f'''
+        SELECT
+            overall as rating,
+            COUNT(*) as count,
+            ROUND(COUNT(*) * 100.0 / SUM(COUNT(*)) OVER (), 2) as percentage
+        FROM reviews
+        {where}
+        GROUP BY overall
+        ORDER BY overall DESC
+    ''', params)
+
+
+def monthly_trends(conn, min_reviews=10, **filters):
+    where, params = where_clause(**filters)
+    return rows(conn, f'''
+        SELECT
+            strftime('%Y-%m', datetime(unixReviewTime, 'unixepoch')) as month,
+            AVG(overall) as avg_rating,
+            COUNT(*) as review_count
+        FROM reviews
+        {where}
+        GROUP BY month
+        HAVING review_count >= ?
+        ORDER BY month
+    ''', params + [min_reviews])
+
+
+def top_products(conn, limit=10, min_reviews=5, **filters):
+    where, params = where_clause(**filters)
+    return rows(conn, f'''
+        SELECT
+            asin,
+            COUNT(*) as review_count,
+            AVG(overall) as avg_rating,
+            COUNT(DISTINCT reviewerID) as unique_reviewers
+        FROM reviews
+        {where}
+        GROUP BY asin
+        HAVING review_count >= ?
+        ORDER BY review_count DESC
+        LIMIT ?
+    ''', params + [min_reviews, limit])
+
+
+def product_review_stats(conn, **filters):
+    where, params = where_clause(**filters)
+    return rows(conn, f'''
+        SELECT
+            COUNT(*) as product_count,
+            AVG(review_count) as avg_reviews_per_product,
+            MAX(review_count) as max_reviews
+        FROM (
+            SELECT asin, COUNT(*) as review_count
+            FROM reviews
+            {where}
+            GROUP BY asin
+        )
+    ''', params)[0]
+
+
+def top_reviewers(conn, limit=10, **filters):
+    where, params = where_clause(**filters)
+    return rows(conn, f'''
+        SELECT
+            reviewerID,
+            COUNT(*) as review_count,
+            AVG(overall) as avg_rating,
+            MIN(unixReviewTime) as first_review,
+            MAX(unixReviewTime) as last_review
+        FROM reviews
+        {where}
+        GROUP BY reviewerID
+        ORDER BY review_count DESC
+        LIMIT ?
+    ''', params + [limit])
+
+
+def reviewer_engagement(conn, **filters):
+    where, params = where_clause(**filters)
+    return rows(conn, f'''
+        SELECT
+            COUNT(*) as reviewer_count,
+            AVG(review_count) as avg_reviews,
+            MAX(review_count) as max_reviews
+        FROM (
+            SELECT reviewerID, COUNT(*) as review_count
+            FROM reviews
+            {where}
+            GROUP BY reviewerID
+        )
+    ''', params)[0]
+
+
+def category_stats(conn, **filters):
+    where, params = where_clause(**filters)
+    return rows(conn, f'''
+        SELECT
+            category,
+            COUNT(*) as review_count,
+            COUNT(DISTINCT asin) as product_count,
+            COUNT(DISTINCT reviewerID) as reviewer_count,
+            AVG(overall) as avg_rating,
+            AVG(review_length) as avg_review_length
+        FROM reviews
+        {where}
+        GROUP BY category
+        ORDER BY review_count DESC
+    ''', params)
+
+
+def helpfulness(conn, **filters):
+    where, params = where_clause(**filters)
+    groups = rows(conn, f'''
+        SELECT
+            CASE
+                WHEN helpful > 0 THEN 'Helpful'
+                ELSE 'Not Helpful'
+            END as helpfulness,
+            COUNT(*) as review_count,
+            AVG(overall) as avg_rating,
+            AVG(review_length) as avg_length
+        FROM reviews
+        {where}
+        GROUP BY helpfulness
+    ''', params)
+    by_rating = rows(conn, f'''
+        SELECT
+            overall as rating,
+            AVG(helpful) as avg_helpful_votes
+        FROM reviews
+        {where}
+        GROUP BY overall
+        ORDER BY overall
+    ''', params)
+    return {'groups': groups, 'by_rating': by_rating}
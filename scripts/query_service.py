@@ -0,0 +1,345 @@
+"""Embedded asyncio HTTP/JSON service over the AmazonEDA aggregates
+
+    GET /overview /ratings /trends /top-products /top-reviewers /categories /helpfulness
+        ?category=&asin=&rating=&since=&until=   (plus limit/min_reviews where relevant)
+    GET /latency   per-endpoint latency histogram
+    GET /health
+
+Queries run on a small pool of read-only SQLite connections in worker
+threads. Identical in-flight requests share one query, and results are
+cached (LRU, at most cache_size entries) for cache_ttl seconds or until
+the database file changes.
+"""
+import asyncio
+import json
+import math
+import os
+import sqlite3
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+try:
+    from scripts import queries
+except ImportError:
+    import queries
+
+# path -> (query function, extra parameters it accepts)
+ENDPOINTS = {
+    '/overview': (queries.overview, ()),
+    '/ratings': (queries.rating_distribution, ()),
+    '/trends': (queries.monthly_trends, ('min_reviews',)),
+    '/top-products': (queries.top_products, ('limit', 'min_reviews')),
+    '/top-reviewers': (queries.top_reviewers, ('limit',)),
+    '/categories': (queries.category_stats, ()),
+    '/helpfulness': (queries.helpfulness, ()),
+}
+PARAM_TYPES = {'rating': float, 'limit': int, 'min_reviews': int}
+LATENCY_BUCKETS_MS = [0.25, 0.5, 1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024, float('inf')]
+STATUS_TEXT = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+               500: 'Internal Server Error'}
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class LatencyRecorder:
+    """Per-endpoint latency histogram plus a window of recent samples for percentiles"""
+
+    def __init__(self, window=10_000):
+        self.window = window
+        self.samples = {}
+        self.buckets = {}
+
+    def record(self, endpoint, ms):
+        """Record one request; callers bound the endpoint names (see QueryService.latency_key)"""
+        self.samples.setdefault(endpoint, deque(maxlen=self.window)).append(ms)
+        counts = self.buckets.setdefault(endpoint, [0] * len(LATENCY_BUCKETS_MS))
+        for i, bound in enumerate(LATENCY_BUCKETS_MS):
+            if ms <= bound:
+                counts[i] += 1
+                break
+
+    def snapshot(self):
+        report = {}
+        for endpoint, samples in self.samples.items():
+            ordered = sorted(samples)
+            report[endpoint] = {
+                'count': sum(self.buckets[endpoint]),
+                'p50_ms': round(percentile(ordered, 50), 3),
+                'p99_ms': round(percentile(ordered, 99), 3),
+                'histogram_ms': {
+                    (f'<={bound:g}' if bound != float('inf') else f'>{LATENCY_BUCKETS_MS[-2]:g}'): count
+                    for bound, count in zip(LATENCY_BUCKETS_MS, self.buckets[endpoint])
+                },
+            }
+        return report
+
+
+class QueryService:
+    """Read-only aggregate service with pooled connections, coalescing and a bounded TTL cache"""
+
+    def __init__(self, db_path='amazon_reviews.db', pool_size=4, cache_ttl=30.0, cache_size=1024):
+        self.db_path = db_path
+        self.pool_size = pool_size
+        self.cache_ttl = cache_ttl
+        self.cache_size = cache_size
+        self.cache = OrderedDict()
+        self.inflight = {}
+        self.latency = LatencyRecorder()
+        self.stats = {'queries': 0, 'cache_hits': 0, 'coalesced': 0}
+        self.executor = None
+        self.pool = None
+        self.server = None
+        self.writers = set()
+
+    def _connect(self):
+        conn = sqlite3.connect(f'file:{os.path.abspath(self.db_path)}?mode=ro', uri=True,
+                               check_same_thread=False)
+        conn.execute("PRAGMA query_only = ON")
+        return conn
+
+    def data_version(self):
+        """Changes whenever the database (or its WAL) is written"""
+        version = []
+        for path in (self.db_path, self.db_path + '-wal'):
+            if os.path.exists(path):
+                stat = os.stat(path)
+                version.append((stat.st_mtime_ns, stat.st_size))
+        return tuple(version)
+
+    async def start(self, host='127.0.0.1', port=8765):
+        """Open the connection pool and start listening; returns the bound port"""
+        self.executor = ThreadPoolExecutor(max_workers=self.pool_size)
+        self.pool = asyncio.Queue()
+        for _ in range(self.pool_size):
+            self.pool.put_nowait(self._connect())
+        self.server = await asyncio.start_server(self._handle_connection, host, port)
+        return self.server.sockets[0].getsockname()[1]
+
+    async def close(self):
+        if self.server:
+            self.server.close()
+            for writer in list(self.writers):
+                writer.close()
+            await asyncio.sleep(0)
+            await self.server.wait_closed()
+        while self.pool and not self.pool.empty():
+            self.pool.get_nowait().close()
+        if self.executor:
+            self.executor.shutdown(wait=False)
+
+    async def serve_forever(self, host='127.0.0.1', port=8765):
+        port = await self.start(host, port)
+        print(f"🌐 Serving {self.db_path} on http://{host}:{port} (Ctrl+C to stop)")
+        try:
+            await self.server.serve_forever()
+        finally:
+            await self.close()
+
+    async def _fetch(self, key, func, params, version):
+        """Run one query on a pooled connection, then encode and cache the result"""
+        conn = await self.pool.get()
+        try:
+            loop = asyncio.get_running_loop()
+            self.stats['queries'] += 1
+            result = await loop.run_in_executor(self.executor, lambda: func(conn, **params))
+        finally:
+            self.pool.put_nowait(conn)
+
+        body = json.dumps(result).encode()
+        if self.cache_ttl > 0 and self.cache_size > 0:
+            self.cache[key] = (version, time.monotonic() + self.cache_ttl, body)
+            self.cache.move_to_end(key)
+            while len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+        return body
+
+    async def query(self, path, params):
+        """JSON body for an endpoint, served from cache or a shared in-flight query"""
+        func, extra = ENDPOINTS[path]
+        allowed = set(queries.FILTERS) | set(extra)
+        unknown = set(params) - allowed
+        if unknown:
+            raise ValueError(f"unknown parameter(s): {', '.join(sorted(unknown))}")
+        params = {key: PARAM_TYPES.get(key, str)(value) for key, value in params.items()}
+
+        key = (path, tuple(sorted(params.items())))
+        version = self.data_version()
+        cached = self.cache.get(key)
+        if cached:
+            if cached[0] == version and cached[1] > time.monotonic():
+                self.cache.move_to_end(key)
+                self.stats['cache_hits'] += 1
+                return cached[2]
+            del self.cache[key]
+
+        task = self.inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(key, func, params, version))
+            self.inflight[key] = task
+            task.add_done_callback(lambda _: self.inflight.pop(key, None))
+        else:
+            self.stats['coalesced'] += 1
+        return await asyncio.shield(task)
+
+    @staticmethod
+    def latency_key(path):
+        """Latency bucket for a request path; unknown paths share one bucket"""
+        return path if path in ENDPOINTS or path in ('/health', '/latency') else 'other'
+
+    async def _dispatch(self, method, target):
+        url = urlsplit(target)
+        if method != 'GET':
+            return 405, {'error': 'only GET is supported'}
+        if url.path == '/health':
+            return 200, {'status': 'ok', **self.stats}
+        if url.path == '/latency':
+            return 200, self.latency.snapshot()
+        if url.path not in ENDPOINTS:
+            return 404, {'error': f'unknown endpoint {url.path}', 'endpoints': sorted(ENDPOINTS)}
+        try:
+            return 200, await self.query(url.path, dict(parse_qsl(url.query)))
+        except (ValueError, OverflowError) as e:
+            # OverflowError: an integer parameter too large for SQLite to bind
+            return 400, {'error': str(e)}
+        except sqlite3.Error as e:
+            return 500, {'error': str(e)}
+
+    async def _handle_connection(self, reader, writer):
+        self.writers.add(writer)
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+                if headers.get('content-length'):
+                    await reader.readexactly(int(headers['content-length']))
+
+                start = time.perf_counter()
+                method, target, version = request_line.decode('latin-1').split()
+                status, payload = await self._dispatch(method, target)
+                body = payload if isinstance(payload, bytes) else json.dumps(payload).encode()
+                keep_alive = version == 'HTTP/1.1' and headers.get('connection', '').lower() != 'close'
+                writer.write(
+                    f"HTTP/1.1 {status} {STATUS_TEXT[status]}\r\n"
+                    f"Content-Type: application/json\r\n"
+                    f"Content-Length: {len(body)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode() + body
+                )
+                await writer.drain()
+                self.latency.record(self.latency_key(urlsplit(target).path), (time.perf_counter() - start) * 1000)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError, OverflowError):
+            pass
+        finally:
+            self.writers.discard(writer)
+            writer.close()
+
+
+class ServiceClient:
+    """Minimal keep-alive HTTP/JSON client for the query service"""
+
+    def __init__(self, host='127.0.0.1', port=8765):
+        self.host = host
+        self.port = port
+        self.reader = None
+        self.writer = None
+
+    async def get(self, path, **params):
+        """GET path with query parameters; returns (status, decoded JSON)"""
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+        params = {key: value for key, value in params.items() if value is not None}
+        target = f"{path}?{urlencode(params)}" if params else path
+        self.writer.write(f"GET {target} HTTP/1.1\r\nHost: {self.host}\r\n\r\n".encode())
+        await self.writer.drain()
+
+        status = int((await self.reader.readline()).split()[1])
+        length = 0
+        while True:
+            line = await self.reader.readline()
+            if line in (b'\r\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            if name.strip().lower() == 'content-length':
+                length = int(value)
+        return status, json.loads(await self.reader.readexactly(length))
+
+    async def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+
+
+def benchmark_requests(categories=()):
+    """Request mix used by the load benchmark: every endpoint, unfiltered and per category"""
+    requests = [(path, {}) for path in ENDPOINTS]
+    for category in categories:
+        requests += [(path, {'category': category}) for path in ENDPOINTS]
+    requests += [('/top-products', {'rating': 5, 'limit': 20}), ('/trends', {'since': '2010-01-01'})]
+    return requests
+
+
+async def load_test(host, port, requests, concurrency=16, total=2000):
+    """Issue total requests from concurrency keep-alive clients; returns latency stats (ms)"""
+    latencies = []
+    errors = 0
+    counter = iter(range(total))
+
+    async def worker():
+        nonlocal errors
+        client = ServiceClient(host, port)
+        try:
+            for i in counter:
+                path, params = requests[i % len(requests)]
+                start = time.perf_counter()
+                status, _ = await client.get(path, **params)
+                latencies.append((time.perf_counter() - start) * 1000)
+                if status != 200:
+                    errors += 1
+        finally:
+            await client.close()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return {
+        'requests': len(latencies),
+        'errors': errors,
+        'concurrency': concurrency,
+        'seconds': round(elapsed, 3),
+        'throughput_rps': round(len(latencies) / elapsed, 1),
+        'p50_ms': round(percentile(latencies, 50), 3),
+        'p99_ms': round(percentile(latencies, 99), 3),
+    }
+
+
+async def run_benchmark(db_path='amazon_reviews.db', concurrency=16, total=2000, cache_ttl=30.0, pool_size=4):
+    """Start an embedded service on a free port and load it with the benchmark request mix"""
+    service = QueryService(db_path, pool_size=pool_size, cache_ttl=cache_ttl)
+    port = await service.start('127.0.0.1', 0)
+    try:
+        conn = service._connect()
+        categories = [row[0] for row in conn.execute("SELECT DISTINCT category FROM reviews")]
+        conn.close()
+        result = await load_test('127.0.0.1', port, benchmark_requests(categories), concurrency, total)
+        result.update(service.stats)
+        return result
+    finally:
+        await service.close()
@@ -0,0 +1,166 @@
+import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    from scripts.plot_helpers import plot_time_series
+except ImportError:
+    from plot_helpers import plot_time_series
+
+DASHBOARD_TITLE = 'Amazon Product Reviews Analysis Dashboard'
+TIME_SERIES_POINTS = 500
+
+_styled = False
+
+
+def pyplot():
+    """Import matplotlib.pyplot on first use and apply the project plot style
+
+    Plotting libraries are imported here rather than at module load so that
+    text-only code paths (reports, the CLI) start quickly.
+    """
+    global _styled
+    import matplotlib.pyplot as plt
+    if not _styled:
+        import seaborn as sns
+        plt.style.use('seaborn-v0_8')
+        sns.set_palette("husl")
+        _styled = True
+    return plt
+
+
+def use_headless_backend():
+    """Force the non-interactive Agg backend (safe on batch nodes without a display)"""
+    import matplotlib
+    matplotlib.use('Agg', force=True)
+
+
+def with_format(output_path, fmt):
+    """Return output_path with its extension replaced by fmt"""
+    return f"{os.path.splitext(output_path)[0]}.{fmt}"
+
+
+def aggregates_hash(aggregates, **params):
+    """Hash the aggregate DataFrames a figure is drawn from, plus any render settings"""
+    digest = hashlib.sha256()
+    for name in sorted(aggregates):
+        digest.update(name.encode())
+        digest.update(aggregates[name].to_csv(index=False).encode())
+    for key in sorted(params):
+        digest.update(f"{key}={params[key]}".encode())
+    return digest.hexdigest()
+
+
+def is_fresh(output_path, digest):
+    """True when output_path exists and was rendered from the same aggregates"""
+    stamp_path = output_path + '.sha256'
+    if not (os.path.exists(output_path) and os.path.exists(stamp_path)):
+        return False
+    with open(stamp_path) as f:
+        return f.read().strip() == digest
+
+
+def mark_fresh(output_path, digest):
+    """Record the aggregate hash next to a rendered file"""
+    with open(output_path + '.sha256', 'w') as f:
+        f.write(digest)
+
+
+def save_figure(fig, output_path, dpi=300):
+    """Save a figure; dpi is ignored by vector formats such as SVG"""
+    directory = os.path.dirname(output_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    fig.savefig(output_path, dpi=dpi, bbox_inches='tight')
+
+
+def draw_dashboard(aggregates, title=DASHBOARD_TITLE):
+    """Draw the six-panel dashboard from precomputed aggregates and return the figure"""
+    import pandas as pd
+    plt = pyplot()
+    fig, axes = plt.subplots(2, 3, figsize=(18, 12))
+    fig.suptitle(title, fontsize=16, fontweight='bold')
+
+    # 1. Rating Distribution
+    rating_data = aggregates['rating']
+    axes[0,0].bar(rating_data['overall'], rating_data['count'], color='skyblue', alpha=0.7)
+    axes[0,0].set_title('Rating Distribution', fontweight='bold')
+    axes[0,0].set_xlabel('Star Rating')
+    axes[0,0].set_ylabel('Number of Reviews')
+
+    # 2. Reviews Over Time
+    time_data = aggregates['time']
+    marker = 'o' if len(time_data) <= 60 else None
+    plot_time_series(axes[0,1], pd.to_datetime(time_data['month']), time_data['review_count'],
+                     threshold=TIME_SERIES_POINTS, marker=marker, linewidth=2)
+    axes[0,1].set_title('Reviews Over Time', fontweight='bold')
+    axes[0,1].set_xlabel('Month')
+    axes[0,1].set_ylabel('Number of Reviews')
+
+    # 3. Category Distribution
+    category_data = aggregates['category']
+    axes[0,2].pie(category_data['review_count'], labels=category_data['category'], autopct='%1.1f%%')
+    axes[0,2].set_title('Reviews by Category', fontweight='bold')
+
+    # 4. Review Length Distribution
+    length_data = aggregates['length']
+    axes[1,0].bar(length_data['length_group'], length_data['count'], color='lightgreen')
+    axes[1,0].set_title('Review Length Distribution', fontweight='bold')
+    axes[1,0].set_xlabel('Review Length (chars)')
+    axes[1,0].set_ylabel('Number of Reviews')
+
+    # 5. Helpfulness vs Rating
+    helpful_data = aggregates['helpful']
+    axes[1,1].plot(helpful_data['overall'], helpful_data['avg_helpful'], marker='s', color='coral')
+    axes[1,1].set_title('Helpfulness vs Rating', fontweight='bold')
+    axes[1,1].set_xlabel('Star Rating')
+    axes[1,1].set_ylabel('Average Helpful Votes')
+
+    # 6. Reviewer Activity
+    reviewer_data = aggregates['reviewer']
+    axes[1,2].pie(reviewer_data['reviewer_count'], labels=reviewer_data['activity_level'], autopct='%1.1f%%')
+    axes[1,2].set_title('Reviewer Activity Levels', fontweight='bold')
+
+    plt.tight_layout()
+    return fig
+
+
+def render_dashboard_job(job):
+    """Render one dashboard job with the current backend; returns the output path"""
+    fig = draw_dashboard(job['aggregates'], job.get('title', DASHBOARD_TITLE))
+    save_figure(fig, job['output_path'], job.get('dpi', 300))
+    pyplot().close(fig)
+    return job['output_path']
+
+
+def _render_in_worker(job):
+    """Pool worker: force Agg in the (batch) worker process, then render"""
+    use_headless_backend()
+    return render_dashboard_job(job)
+
+
+def render_dashboards(jobs, max_workers=None, force=False):
+    """Render many dashboards in a process pool, skipping those whose aggregates are unchanged
+
+    Each job is a dict with 'aggregates', 'output_path' and optional 'title', 'dpi'.
+    A single stale job is rendered in-process with the caller's backend; pool
+    workers always use Agg. Returns (rendered_paths, skipped_paths).
+    """
+    stale, skipped = [], []
+    for job in jobs:
+        digest = aggregates_hash(job['aggregates'], dpi=job.get('dpi', 300), title=job.get('title', DASHBOARD_TITLE))
+        if not force and is_fresh(job['output_path'], digest):
+            skipped.append(job['output_path'])
+        else:
+            stale.append((job, digest))
+
+    if max_workers == 1 or len(stale) <= 1:
+        rendered = [render_dashboard_job(job) for job, _ in stale]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            rendered = list(pool.map(_render_in_worker, [job for job, _ in stale]))
+
+    for job, digest in stale:
+        mark_fresh(job['output_path'], digest)
+
+    return rendered, skipped
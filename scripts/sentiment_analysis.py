@@ -1,27 +1,49 @@
+import random
 import sqlite3
 import pandas as pd
-from textblob import TextBlob
-import matplotlib.pyplot as plt
-import seaborn as sns
+
+try:
+    from scripts.plot_helpers import histogram_summary, histogram_violin, quantile_summary, summary_boxplot
+    from scripts.rendering import (aggregates_hash, is_fresh, mark_fresh, pyplot, save_figure,
+                                   use_headless_backend, with_format)
+except ImportError:
+    from plot_helpers import histogram_summary, histogram_violin, quantile_summary, summary_boxplot
+    from rendering import (aggregates_hash, is_fresh, mark_fresh, pyplot, save_figure,
+                           use_headless_backend, with_format)
 
 class SentimentAnalysis:
     def __init__(self, db_path='amazon_reviews.db'):
         self.db_path = db_path
         self.conn = sqlite3.connect(db_path)
     
-    def analyze_sentiment(self, sample_size=1000):
+    def sample_reviews(self, sample_size=1000, seed=42):
+        """Sample reviews for analysis (to avoid processing all)
+        
+        With a seed the sample is a fixed pseudo-random function of the rowids,
+        so unchanged data gives the same sample (and the plot cache can skip
+        redrawing). seed=None draws a fresh random sample each call.
+        """
+        if seed is None:
+            order = "RANDOM()"
+        else:
+            # Multiplicative hash of rowid modulo a prime; the seed picks the multiplier
+            multiplier = random.Random(seed).randrange(1 << 20, 1 << 31)
+            order = f"(rowid * {multiplier}) % 4294967291"
+        return pd.read_sql_query(f'''
+            SELECT reviewText, overall, category
+            FROM reviews 
+            WHERE reviewText IS NOT NULL AND review_length > 10
+            ORDER BY {order}
+            LIMIT ?
+        ''', self.conn, params=(int(sample_size),))
+    
+    def analyze_sentiment(self, sample_size=1000, seed=42):
         """Perform sentiment analysis on review text"""
+        from textblob import TextBlob
         
         print("🧠 Performing Sentiment Analysis...")
         
-        # Sample reviews for analysis (to avoid processing all)
-        reviews = pd.read_sql_query(f'''
-            SELECT reviewText, overall, category
-            FROM reviews 
-            WHERE reviewText IS NOT NULL AND LENGTH(reviewText) > 10
-            ORDER BY RANDOM()
-            LIMIT {sample_size}
-        ''', self.conn)
+        reviews = self.sample_reviews(sample_size, seed)
         
         print(f"Analyzing sentiment for {len(reviews)} reviews...")
         
@@ -37,22 +59,51 @@ class SentimentAnalysis:
         
         return reviews
     
-    def sentiment_vs_rating(self, reviews):
-        """Compare sentiment analysis with star ratings"""
+    def sentiment_vs_rating(self, reviews, output_path='sentiment_vs_rating.png', fmt='png', dpi=300,
+                            headless=False, force=False, kind='box'):
+        """Compare sentiment analysis with star ratings
+        
+        The plot is drawn from per-rating quantiles (kind='box') or histograms
+        (kind='violin') rather than raw rows. headless forces the Agg backend and
+        skips plt.show(); the plot is not redrawn when the summary hashes the
+        same as the last saved file, which only happens for seeded samples.
+        """
         
         print("\n⭐ Sentiment vs Star Ratings:")
         correlation = reviews[['overall', 'sentiment']].corr().iloc[0,1]
         print(f"Correlation between rating and sentiment: {correlation:.3f}")
         
+        if headless:
+            use_headless_backend()
+        
+        if kind == 'violin':
+            summary = histogram_summary(reviews, 'overall', 'sentiment', bins=40, value_range=(-1, 1))
+        else:
+            summary = quantile_summary(reviews, 'overall', 'sentiment')
+        
+        output_path = with_format(output_path, fmt)
+        digest = aggregates_hash({'sentiment': summary}, dpi=dpi, kind=kind)
+        if not force and is_fresh(output_path, digest):
+            print(f"⏭️ Sentiment plot unchanged, skipping render: {output_path}")
+            return correlation
+        
         # Plot sentiment by rating
-        plt.figure(figsize=(10, 6))
-        sns.boxplot(data=reviews, x='overall', y='sentiment')
+        plt = pyplot()
+        fig, ax = plt.subplots(figsize=(10, 6))
+        if kind == 'violin':
+            histogram_violin(ax, summary, 'overall')
+        else:
+            summary_boxplot(ax, summary, 'overall')
         plt.title('Sentiment Polarity by Star Rating')
         plt.xlabel('Star Rating')
         plt.ylabel('Sentiment Polarity')
         plt.tight_layout()
-        plt.savefig('sentiment_vs_rating.png', dpi=300, bbox_inches='tight')
-        plt.show()
+        save_figure(fig, output_path, dpi)
+        mark_fresh(output_path, digest)
+        if headless:
+            plt.close(fig)
+        else:
+            plt.show()
         
         return correlation
 
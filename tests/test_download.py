@@ -0,0 +1,47 @@
+import functools
+import http.server
+import os
+import sys
+import threading
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data.download_amazon import fetch_if_changed  # noqa: E402
+
+
+@pytest.fixture
+def server(tmp_path):
+    """Static file server; SimpleHTTPRequestHandler answers If-Modified-Since with 304"""
+    root = tmp_path / 'remote'
+    root.mkdir()
+    handler = functools.partial(http.server.SimpleHTTPRequestHandler, directory=str(root))
+    handler.log_message = lambda *args: None
+    httpd = http.server.ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield root, f'http://127.0.0.1:{httpd.server_address[1]}'
+    httpd.shutdown()
+
+
+def test_unchanged_remote_is_not_downloaded_again(server, tmp_path):
+    root, base = server
+    (root / 'reviews.json.gz').write_bytes(b'v1')
+    os.utime(root / 'reviews.json.gz', (1_600_000_000, 1_600_000_000))
+    url, gz_path, csv_path = f'{base}/reviews.json.gz', str(tmp_path / 'r.gz'), str(tmp_path / 'r.csv')
+    state = {}
+
+    assert fetch_if_changed(url, gz_path, csv_path, state)
+    assert state[url]['last_modified']
+
+    # No CSV yet: validators are not sent, so the file is fetched again
+    assert fetch_if_changed(url, gz_path, csv_path, state)
+
+    open(csv_path, 'w').close()
+    assert not fetch_if_changed(url, gz_path, csv_path, state)
+
+    (root / 'reviews.json.gz').write_bytes(b'v2')
+    os.utime(root / 'reviews.json.gz', (1_700_000_000, 1_700_000_000))
+    assert fetch_if_changed(url, gz_path, csv_path, state)
+    with open(gz_path, 'rb') as f:
+        assert f.read() == b'v2'
@@ -0,0 +1,43 @@
+import os
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Everything `amazon_cli.py report` imports before it touches the database
+REPORT_STARTUP = "import amazon_cli, scripts.amazon_eda"
+# Budget for the project's own modules only; pandas/numpy dominate the total
+# and vary too much between machines to gate on.
+PROJECT_MODULES = ('amazon_cli', 'scripts')
+PROJECT_BUDGET_SECONDS = 0.25
+HEAVY_MODULES = ('matplotlib', 'seaborn', 'textblob', 'nltk')
+
+
+def import_times(statement):
+    """Run statement under -X importtime and return {module: self_microseconds}"""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        cwd=REPO_ROOT, capture_output=True, text=True, check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, _, module = line[len('import time:'):].split('|')
+        times[module.strip()] = int(self_us)
+    return times
+
+
+def test_report_startup_skips_plotting_and_nlp():
+    loaded = import_times(REPORT_STARTUP)
+    heavy = sorted(m for m in loaded if m.split('.')[0] in HEAVY_MODULES)
+    assert heavy == []
+
+
+def test_project_modules_import_within_budget():
+    # Best of three to smooth out a cold disk cache
+    totals = []
+    for _ in range(3):
+        loaded = import_times(REPORT_STARTUP)
+        totals.append(sum(us for m, us in loaded.items() if m.split('.')[0] in PROJECT_MODULES) / 1e6)
+    assert min(totals) < PROJECT_BUDGET_SECONDS, f"project module imports took {min(totals):.3f}s"
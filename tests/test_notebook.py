@@ -0,0 +1,62 @@
+import json
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from create_notebook import build_notebook, export_artifacts  # noqa: E402
+from scripts.init_database import initialize_amazon_database  # noqa: E402
+
+COLUMNS = ['reviewerID', 'asin', 'overall', 'reviewText', 'summary', 'helpful', 'unixReviewTime']
+REVIEWS = [
+    (f'R{i % 7}', f'A{i % 4}', float(i % 5 + 1), 'word ' * (i * 13 % 90), f'Summary {i}', i % 3, 1262304000 + i * 86400 * 20)
+    for i in range(60)
+]
+
+
+@pytest.fixture
+def db_path(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    os.makedirs('data')
+    pd.DataFrame(REVIEWS, columns=COLUMNS).to_csv('data/amazon_reviews_electronics.csv', index=False)
+    assert initialize_amazon_database()
+    return 'amazon_reviews.db'
+
+
+def test_export_writes_manifest_and_round_trips(db_path):
+    assert export_artifacts(db_path, 'artifacts', sample_size=25)
+
+    with open('artifacts/manifest.json') as f:
+        manifest = json.load(f)
+    assert set(manifest) == {'created', 'database', 'data_version', 'artifacts'}
+    assert manifest['database'] == os.path.abspath(db_path)
+    assert len(manifest['artifacts']) == 13
+
+    for name, artifact in manifest['artifacts'].items():
+        frame = pd.read_parquet(f'artifacts/{name}.parquet')
+        assert len(frame) == artifact['rows'], name
+        assert artifact['bytes'] == os.path.getsize(f'artifacts/{name}.parquet')
+
+    assert pd.read_parquet('artifacts/overview.parquet').loc[0, 'total_reviews'] == len(REVIEWS)
+    sample = pd.read_parquet('artifacts/review_sample.parquet')
+    assert len(sample) == 25
+    assert sample['reviewerID'].isin({review[0] for review in REVIEWS}).all()
+
+
+def test_sample_is_seeded(db_path):
+    assert export_artifacts(db_path, 'first', sample_size=10, seed=7)
+    assert export_artifacts(db_path, 'second', sample_size=10, seed=7)
+    first = pd.read_parquet('first/review_sample.parquet')
+    assert first.equals(pd.read_parquet('second/review_sample.parquet'))
+
+
+def test_notebook_reads_only_artifacts():
+    notebook = build_notebook('artifacts')
+    code = ''.join(line for cell in notebook['cells'] if cell['cell_type'] == 'code' for line in cell['source'])
+    assert "ARTIFACTS = Path('artifacts')" in code
+    assert 'read_parquet' in code
+    for database_access in ('sqlite3', 'read_sql', 'AmazonEDA', '.db'):
+        assert database_access not in code
@@ -0,0 +1,100 @@
+import json
+import os
+import sys
+from functools import partial
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scripts.pipeline import Pipeline, Stage  # noqa: E402
+
+
+def concat(output, *inputs):
+    """Stage function: write the concatenated inputs to output"""
+    with open(output, 'w') as f:
+        for path in inputs:
+            with open(path) as src:
+                f.write(src.read())
+
+
+def make_pipeline(tmp_path):
+    source, left, right, both = (str(tmp_path / name) for name in ('source.txt', 'left.txt', 'right.txt', 'both.txt'))
+    other = str(tmp_path / 'other.txt')
+    for path in (source, other):
+        if not os.path.exists(path):
+            with open(path, 'w') as f:
+                f.write(os.path.basename(path))
+    stages = [
+        Stage('left', partial(concat, left, source), inputs=[source], outputs=[left]),
+        Stage('right', partial(concat, right, other), inputs=[other], outputs=[right]),
+        Stage('both', partial(concat, both, left, right), inputs=[left, right], outputs=[both]),
+    ]
+    return Pipeline(stages, state_path=str(tmp_path / 'state.json'),
+                    manifest_path=str(tmp_path / 'manifest.json'), max_workers=2)
+
+
+def statuses(tmp_path):
+    with open(tmp_path / 'manifest.json') as f:
+        return {name: stage['status'] for name, stage in json.load(f)['stages'].items()}
+
+
+def test_unchanged_inputs_are_skipped_and_edits_rerun_downstream(tmp_path):
+    assert make_pipeline(tmp_path).run()
+    assert statuses(tmp_path) == {'left': 'ran', 'right': 'ran', 'both': 'ran'}
+
+    assert make_pipeline(tmp_path).run()
+    assert statuses(tmp_path) == {'left': 'skipped', 'right': 'skipped', 'both': 'skipped'}
+
+    with open(tmp_path / 'source.txt', 'a') as f:
+        f.write(' edited')
+    assert make_pipeline(tmp_path).run()
+    assert statuses(tmp_path) == {'left': 'ran', 'right': 'skipped', 'both': 'ran'}
+    assert (tmp_path / 'both.txt').read_text() == 'source.txt editedother.txt'
+
+
+def test_failed_stage_blocks_dependents(tmp_path):
+    missing = str(tmp_path / 'never-written.txt')
+    after = str(tmp_path / 'after.txt')
+    stages = [
+        Stage('broken', partial(concat, missing, str(tmp_path / 'absent')), outputs=[missing]),
+        Stage('after', partial(concat, after, missing), inputs=[missing], outputs=[after]),
+    ]
+    pipeline = Pipeline(stages, state_path=str(tmp_path / 'state.json'),
+                        manifest_path=str(tmp_path / 'manifest.json'))
+    assert not pipeline.run()
+    assert statuses(tmp_path) == {'broken': 'failed', 'after': 'blocked'}
+
+
+def test_dependency_cycle_is_blocked_instead_of_hanging(tmp_path):
+    a, b = str(tmp_path / 'a.txt'), str(tmp_path / 'b.txt')
+    stages = [
+        Stage('a', partial(concat, a, b), inputs=[b], outputs=[a]),
+        Stage('b', partial(concat, b, a), inputs=[a], outputs=[b]),
+    ]
+    pipeline = Pipeline(stages, state_path=str(tmp_path / 'state.json'),
+                        manifest_path=str(tmp_path / 'manifest.json'))
+    assert not pipeline.run()
+    assert statuses(tmp_path) == {'a': 'blocked', 'b': 'blocked'}
+
+
+def test_always_stage_runs_but_unchanged_output_skips_downstream(tmp_path):
+    source, copy = str(tmp_path / 'source.txt'), str(tmp_path / 'copy.txt')
+    with open(source, 'w') as f:
+        f.write('v1')
+    fetched = str(tmp_path / 'fetched.txt')
+
+    def pipeline():
+        stages = [
+            Stage('fetch', partial(concat, fetched, source), outputs=[fetched], always=True),
+            Stage('copy', partial(concat, copy, fetched), inputs=[fetched], outputs=[copy]),
+        ]
+        return Pipeline(stages, state_path=str(tmp_path / 'state.json'),
+                        manifest_path=str(tmp_path / 'manifest.json'))
+
+    assert pipeline().run()
+    assert pipeline().run()
+    assert statuses(tmp_path) == {'fetch': 'ran', 'copy': 'skipped'}
+
+    with open(source, 'w') as f:
+        f.write('v2')
+    assert pipeline().run()
+    assert statuses(tmp_path) == {'fetch': 'ran', 'copy': 'ran'}
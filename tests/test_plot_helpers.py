@@ -0,0 +1,32 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scripts.plot_helpers import lttb  # noqa: E402
+
+
+def test_keeps_endpoints_and_threshold_increasing_indices():
+    x = np.arange(1000)
+    y = np.sin(x / 25.0)
+    kept = lttb(x, y, 50)
+    assert len(kept) == 50
+    assert kept[0] == 0 and kept[-1] == 999
+    assert np.all(np.diff(kept) > 0)
+
+
+@pytest.mark.parametrize('threshold', [10, 11, 2, 0])
+def test_passes_through_when_nothing_to_drop(threshold):
+    x = np.arange(10)
+    assert list(lttb(x, x * 2.0, threshold)) == list(range(10))
+
+
+def test_spike_survives_downsampling():
+    x = np.arange(10_000)
+    y = np.zeros(10_000)
+    y[6_543] = 100.0
+    kept = lttb(x, y, 100)
+    assert 6_543 in kept
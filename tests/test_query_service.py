@@ -0,0 +1,199 @@
+import asyncio
+import os
+import sqlite3
+import sys
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scripts import queries  # noqa: E402
+from scripts.query_service import QueryService, ServiceClient, load_test  # noqa: E402
+
+REVIEWS = [
+    # reviewerID, asin, overall, category, helpful, unixReviewTime, review_length
+    ('R1', 'A1', 5.0, 'electronics', 2, 1262304000, 120),
+    ('R2', 'A1', 4.0, 'electronics', 0, 1264982400, 40),
+    ('R3', 'A2', 1.0, 'books', 5, 1293840000, 300),
+    ('R1', 'A2', 5.0, 'books', 1, 1296518400, 80),
+]
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = tmp_path / 'reviews.db'
+    conn = sqlite3.connect(path)
+    conn.execute('''
+        CREATE TABLE reviews (
+            reviewerID TEXT, asin TEXT, overall REAL, category TEXT,
+            helpful INTEGER, unixReviewTime INTEGER, review_length INTEGER
+        )
+    ''')
+    conn.executemany("INSERT INTO reviews VALUES (?, ?, ?, ?, ?, ?, ?)", REVIEWS)
+    conn.commit()
+    conn.close()
+    return str(path)
+
+
+def with_service(db_path, scenario, **options):
+    """Start a service on a free port, run scenario(service, client), then shut down"""
+    async def run():
+        service = QueryService(db_path, **options)
+        port = await service.start('127.0.0.1', 0)
+        client = ServiceClient('127.0.0.1', port)
+        try:
+            return await scenario(service, client, port)
+        finally:
+            await client.close()
+            await service.close()
+    return asyncio.run(run())
+
+
+def test_endpoints_apply_filters(db_path):
+    async def scenario(service, client, port):
+        status, overview = await client.get('/overview')
+        assert status == 200
+        assert overview['total_reviews'] == 4
+
+        status, ratings = await client.get('/ratings', category='books')
+        assert {row['rating']: row['count'] for row in ratings} == {5.0: 1, 1.0: 1}
+
+        status, products = await client.get('/top-products', min_reviews=1, since='2011-01-01')
+        assert [row['asin'] for row in products] == ['A2']
+
+        status, categories = await client.get('/categories', rating=5)
+        assert {row['category'] for row in categories} == {'electronics', 'books'}
+
+    with_service(db_path, scenario)
+
+
+def test_bad_requests(db_path):
+    async def scenario(service, client, port):
+        assert (await client.get('/overview', colour='red'))[0] == 400
+        assert (await client.get('/missing'))[0] == 404
+        assert (await client.get('/top-products', limit='ten'))[0] == 400
+        status, error = await client.get('/top-products', limit='9' * 23)
+        assert status == 400 and 'error' in error
+        assert (await client.get('/health'))[0] == 200
+
+    with_service(db_path, scenario)
+
+
+def test_identical_inflight_requests_are_coalesced(db_path):
+    async def scenario(service, client, port):
+        clients = [ServiceClient('127.0.0.1', port) for _ in range(10)]
+        results = await asyncio.gather(*(c.get('/helpfulness') for c in clients))
+        for c in clients:
+            await c.close()
+        assert all(status == 200 for status, _ in results)
+        assert service.stats['queries'] == 1
+        assert service.stats['coalesced'] == 9
+
+    with_service(db_path, scenario)
+
+
+def test_cache_is_invalidated_when_data_changes(db_path):
+    async def scenario(service, client, port):
+        await client.get('/overview')
+        await client.get('/overview')
+        assert service.stats == {'queries': 1, 'cache_hits': 1, 'coalesced': 0}
+
+        conn = sqlite3.connect(db_path)
+        conn.execute("INSERT INTO reviews VALUES ('R9', 'A9', 3.0, 'books', 0, 1300000000, 10)")
+        conn.commit()
+        conn.close()
+        os.utime(db_path, ns=(0, os.stat(db_path).st_mtime_ns + 1_000_000_000))
+
+        status, overview = await client.get('/overview')
+        assert overview['total_reviews'] == 5
+        assert service.stats['queries'] == 2
+
+    with_service(db_path, scenario, cache_ttl=60)
+
+
+def test_latency_endpoint_and_load_test(db_path):
+    async def scenario(service, client, port):
+        result = await load_test('127.0.0.1', port, [('/overview', {}), ('/trends', {})],
+                                 concurrency=4, total=40)
+        assert result['requests'] == 40 and result['errors'] == 0
+        assert result['p50_ms'] <= result['p99_ms']
+
+        status, latency = await client.get('/latency')
+        assert latency['/overview']['count'] == 20
+        assert sum(latency['/trends']['histogram_ms'].values()) == 20
+
+    with_service(db_path, scenario)
+
+
+def test_cache_is_bounded_and_drops_stale_entries(db_path):
+    async def scenario(service, client, port):
+        for category in ('electronics', 'books', 'toys'):
+            await client.get('/overview', category=category)
+        assert [dict(key[1])['category'] for key in service.cache] == ['books', 'toys']
+
+        await client.get('/overview', category='books')
+        assert service.stats['cache_hits'] == 1
+        assert [dict(key[1])['category'] for key in service.cache] == ['toys', 'books']
+
+        key = next(iter(service.cache))
+        version, _, body = service.cache[key]
+        service.cache[key] = (version, 0, body)
+        await client.get('/overview', category='toys')
+        assert service.stats['queries'] == 4
+
+    with_service(db_path, scenario, cache_ttl=60, cache_size=2)
+
+
+def test_latency_is_recorded_for_known_endpoints_only(db_path):
+    async def scenario(service, client, port):
+        for i in range(5):
+            await client.get(f'/probe-{i}')
+        await client.get('/overview')
+        status, latency = await client.get('/latency')
+        assert set(latency) == {'/overview', 'other'}
+        assert latency['other']['count'] == 5
+
+    with_service(db_path, scenario)
+
+
+def test_dates_are_parsed_as_utc():
+    assert queries.unix_time('2012-01-01') == 1325376000
+    assert queries.unix_time('1325376000') == 1325376000
+    assert queries.unix_time('2012-01-01T00:00:00-06:00') == 1325397600
+
+
+@pytest.mark.skipif(not hasattr(time, 'tzset'), reason="changing the process timezone needs time.tzset (POSIX)")
+def test_dates_are_utc_regardless_of_local_timezone(monkeypatch):
+    monkeypatch.setenv('TZ', 'America/Chicago')
+    time.tzset()
+    try:
+        assert queries.unix_time('2012-01-01') == 1325376000
+        assert queries.unix_time('1325376000') == 1325376000
+        assert queries.unix_time('2012-01-01T00:00:00-06:00') == 1325397600
+    finally:
+        monkeypatch.delenv('TZ')
+        time.tzset()
+
+
+def test_amazon_eda_and_service_share_queries(db_path):
+    import contextlib
+    import io
+    from scripts.amazon_eda import AmazonEDA
+
+    eda = AmazonEDA(db_path)
+    with contextlib.redirect_stdout(io.StringIO()):
+        rating_dist, monthly = eda.rating_analysis()
+        top_products, _ = eda.product_analysis()
+        books_ratings, _ = eda.rating_analysis(category='books')
+        recent_products, _ = eda.product_analysis(since='2011-01-01')
+        helpful, _ = eda.helpfulness_analysis(rating=5)
+    conn = sqlite3.connect(db_path)
+    assert rating_dist.to_dict('records') == queries.rating_distribution(conn)
+    assert monthly.to_dict('records') == queries.monthly_trends(conn)
+    assert top_products.to_dict('records') == queries.top_products(conn)
+    assert books_ratings.to_dict('records') == queries.rating_distribution(conn, category='books')
+    assert recent_products.to_dict('records') == queries.top_products(conn, since='2011-01-01')
+    assert helpful['review_count'].sum() == 2
+    conn.close()
+    eda.conn.close()
@@ -0,0 +1,81 @@
+import os
+import sqlite3
+import sys
+
+import matplotlib
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scripts.rendering import render_dashboards  # noqa: E402
+from scripts.sentiment_analysis import SentimentAnalysis  # noqa: E402
+
+
+def aggregates(five_star=40):
+    return {
+        'rating': pd.DataFrame({'overall': [1.0, 5.0], 'count': [10, five_star]}),
+        'time': pd.DataFrame({'month': ['2012-01', '2012-02'], 'review_count': [20, 30]}),
+        'category': pd.DataFrame({'category': ['books'], 'review_count': [50]}),
+        'length': pd.DataFrame({'length_group': ['0-50', '50+'], 'count': [25, 25]}),
+        'helpful': pd.DataFrame({'overall': [1.0, 5.0], 'avg_helpful': [0.5, 1.5]}),
+        'reviewer': pd.DataFrame({'activity_level': ['1', '2-5'], 'reviewer_count': [30, 5]}),
+    }
+
+
+def jobs(tmp_path, **changes):
+    return [
+        {'aggregates': aggregates(changes.get(name, 40)), 'output_path': str(tmp_path / f'{name}.svg'),
+         'title': name, 'dpi': 50}
+        for name in ('books', 'toys')
+    ]
+
+
+@pytest.fixture
+def svg_backend():
+    """Run with a non-Agg backend so in-process renders can be checked for backend changes"""
+    previous = matplotlib.get_backend()
+    matplotlib.use('svg', force=True)
+    yield
+    matplotlib.use(previous, force=True)
+
+
+def test_unchanged_dashboards_are_skipped(tmp_path, svg_backend):
+    rendered, skipped = render_dashboards(jobs(tmp_path), max_workers=2)
+    assert len(rendered) == 2 and skipped == []
+    assert all(os.path.exists(path + '.sha256') for path in rendered)
+
+    rendered, skipped = render_dashboards(jobs(tmp_path), max_workers=2)
+    assert rendered == [] and len(skipped) == 2
+
+    # One changed job renders in-process and leaves the caller's backend alone
+    rendered, skipped = render_dashboards(jobs(tmp_path, toys=41), max_workers=2)
+    assert rendered == [str(tmp_path / 'toys.svg')] and skipped == [str(tmp_path / 'books.svg')]
+    assert matplotlib.get_backend().lower() == 'svg'
+
+    rendered, skipped = render_dashboards(jobs(tmp_path, toys=41), max_workers=2, force=True)
+    assert len(rendered) == 2 and skipped == []
+
+
+def test_seeded_sentiment_sample_is_stable_and_plot_is_skipped(tmp_path, capsys):
+    db_path = str(tmp_path / 'reviews.db')
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE reviews (reviewText TEXT, overall REAL, category TEXT, review_length INTEGER)")
+    conn.executemany("INSERT INTO reviews VALUES (?, ?, 'books', 20)",
+                     [(f'review number {i:04d}', float(i % 5 + 1)) for i in range(200)])
+    conn.commit()
+    conn.close()
+
+    sa = SentimentAnalysis(db_path)
+    sample = sa.sample_reviews(50)
+    assert len(sample) == 50
+    pd.testing.assert_frame_equal(sample, sa.sample_reviews(50))
+    assert not sample.equals(sa.sample_reviews(50, seed=7))
+
+    sample['sentiment'] = (sample['overall'] - 3) / 2
+    output = str(tmp_path / 'sentiment.png')
+    sa.sentiment_vs_rating(sample, output, dpi=50, headless=True)
+    capsys.readouterr()
+    sa.sentiment_vs_rating(sample, output, dpi=50, headless=True)
+    assert 'skipping render' in capsys.readouterr().out
+    sa.conn.close()
@@ -0,0 +1,97 @@
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scripts.amazon_eda import AmazonEDA  # noqa: E402
+from scripts.init_database import initialize_amazon_database  # noqa: E402
+
+COLUMNS = ['reviewerID', 'asin', 'overall', 'reviewText', 'summary', 'helpful', 'unixReviewTime']
+ELECTRONICS = [
+    ('R1', 'A1', 5.0, 'The battery lasts all week', 'Great battery', 3, 1262304000),
+    ('R2', 'A1', 1.0, 'Battery died after a day', 'Broke fast', 1, 1293840000),
+    ('R3', 'A2', 4.0, 'Screen is sharp and bright', 'Nice screen', 0, 1325376000),
+]
+BOOKS = [
+    ('R4', 'B1', 5.0, 'A gripping plot, no battery required', 'Loved it', 2, 1262304000),
+    ('R5', 'B2', 2.0, 'Slow plot and flat characters', 'Dull', 0, 1325376000),
+]
+
+
+def write_csv(name, rows):
+    pd.DataFrame(rows, columns=COLUMNS).to_csv(f'data/amazon_reviews_{name}.csv', index=False)
+
+
+@pytest.fixture
+def eda(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    os.makedirs('data')
+    write_csv('electronics', ELECTRONICS)
+    write_csv('books', BOOKS)
+    assert initialize_amazon_database(fts=True)
+    eda = AmazonEDA('amazon_reviews.db')
+    yield eda
+    eda.conn.close()
+
+
+def test_search_ranks_and_filters(eda):
+    hits, facets = eda.search('battery')
+    assert len(hits) == 3
+    assert dict(zip(facets['category']['category'], facets['category']['hits'])) == {'electronics': 2, 'books': 1}
+
+    hits, _ = eda.search('battery', rating=1)
+    assert list(hits['reviewerID']) == ['R2']
+    hits, _ = eda.search('battery', category='books')
+    assert list(hits['reviewerID']) == ['R4']
+
+
+def test_search_time_filters_accept_dates_and_epoch_strings(eda):
+    hits, _ = eda.search('battery', since='1293840000')
+    assert list(hits['reviewerID']) == ['R2']
+    hits, _ = eda.search('battery', until='2011-01-01')
+    assert set(hits['reviewerID']) == {'R1', 'R4'}
+
+
+def test_term_frequency_by_rating(eda):
+    frequencies = eda.term_frequency_by_rating(['battery', 'plot'])
+    assert frequencies.loc[5].to_dict() == {'battery': 2, 'plot': 1}
+    assert frequencies.loc[2].to_dict() == {'battery': 0, 'plot': 1}
+
+    electronics = eda.term_frequency_by_rating(['battery'], category='electronics')
+    assert electronics['battery'].to_dict() == {1: 1, 2: 0, 3: 0, 4: 0, 5: 1}
+
+
+def test_full_reload_and_incremental_append_keep_index_in_sync(eda):
+    write_csv('electronics', ELECTRONICS + [('R6', 'A3', 3.0, 'Charger works but the cable frays', 'Okay', 0, 1356998400)])
+    assert initialize_amazon_database(incremental=True)
+    hits, _ = eda.search('cable')
+    assert list(hits['reviewerID']) == ['R6']
+    assert len(eda.search('battery')[0]) == 3
+
+    write_csv('electronics', ELECTRONICS[:1])
+    assert initialize_amazon_database()
+    assert set(eda.search('battery')[0]['reviewerID']) == {'R1', 'R4'}
+    assert len(eda.search('cable')[0]) == 0
+
+
+@pytest.mark.parametrize('query', ['wi-fi', 'USB-C', "don't"])
+def test_unparseable_queries_report_instead_of_raising(eda, query, capsys):
+    assert eda.search(query) == (None, None)
+    assert eda.term_frequency_by_rating([query]) is None
+    assert 'Bad search query' in capsys.readouterr().out
+
+
+def test_plain_mode_matches_hyphens_and_apostrophes(eda):
+    write_csv('electronics', ELECTRONICS + [
+        ('R7', 'A4', 4.0, "Wi-Fi is fast and I don't miss cables", 'USB-C dock', 1, 1356998400),
+    ])
+    assert initialize_amazon_database(incremental=True)
+
+    for query in ('wi-fi', 'USB-C', "don't", 'usb-c "dock'):
+        hits, _ = eda.search(query, plain=True)
+        assert list(hits['reviewerID']) == ['R7'], query
+    frequencies = eda.term_frequency_by_rating(['wi-fi'], plain=True)
+    assert frequencies['wi-fi'].to_dict() == {1: 0, 2: 0, 3: 0, 4: 1, 5: 0}
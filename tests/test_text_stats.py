@@ -0,0 +1,133 @@
+import multiprocessing
+import os
+import shutil
+import sqlite3
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scripts.amazon_eda import AmazonEDA  # noqa: E402
+from scripts.init_database import add_text_statistics, ensure_text_statistics  # noqa: E402
+
+REVIEWS = [
+    # overall, category, review_length
+    (5.0, 'books', 0),
+    (4.0, 'books', 49),
+    (None, 'books', 50),
+    (2.0, 'electronics', 199),
+    (1.0, 'electronics', 200),
+    (3.0, 'electronics', None),
+]
+
+
+def make_db(path, reviews=REVIEWS):
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE reviews (overall REAL, category TEXT, review_length INTEGER)")
+    conn.executemany("INSERT INTO reviews VALUES (?, ?, ?)", reviews)
+    conn.commit()
+    conn.close()
+
+
+@pytest.fixture
+def eda(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    make_db('reviews.db')
+    eda = AmazonEDA('reviews.db')
+    yield eda
+    eda.conn.close()
+
+
+def test_histogram_bins_are_left_closed_and_skip_nulls(eda):
+    histogram = eda.text_stat_histogram([0, 50, 200, np.inf])
+    assert list(histogram['bin']) == ['0-50', '50-200', '200+']
+    assert list(histogram['count']) == [2, 2, 1]
+    # The NULL rating in 50-200 is counted but left out of the average
+    assert list(histogram['avg_rating']) == [4.5, 2.0, 1.0]
+
+
+def test_histogram_drops_values_outside_the_edges(eda):
+    assert list(eda.text_stat_histogram([10, 100])['count']) == [2]
+
+
+def test_histogram_category_filter_and_grouping(eda):
+    assert list(eda.text_stat_histogram([0, 50, 200, np.inf], category='electronics')['count']) == [0, 1, 1]
+    assert eda.text_stat_histogram([0, 50], category='toys')['count'].sum() == 0
+
+    by_category = eda.text_stat_histogram([0, 50, np.inf], by='category')
+    counts = by_category.set_index(['category', 'bin'])['count'].to_dict()
+    assert counts == {('books', '0-50'): 2, ('books', '50+'): 1,
+                      ('electronics', '0-50'): 0, ('electronics', '50+'): 2}
+
+
+def test_quantiles_overall_and_by_category(eda):
+    assert eda.text_stat_quantiles([0.5]).loc['review_length', 0.5] == 50
+    by_category = eda.text_stat_quantiles([0.5], by='category')
+    assert by_category[0.5].to_dict() == {'books': 49.0, 'electronics': 199.5}
+
+
+def test_extracts_are_refreshed_and_kept_per_database(eda, tmp_path):
+    assert eda.text_stat_histogram([0, np.inf])['count'].sum() == 5
+
+    make_db('other.db', [(5.0, 'books', 10)])
+    other = AmazonEDA('other.db')
+    assert other.text_stat_histogram([0, np.inf])['count'].sum() == 1
+    other.conn.close()
+
+    eda.conn.execute("INSERT INTO reviews VALUES (5.0, 'books', 500)")
+    eda.conn.commit()
+    assert eda.text_stat_histogram([0, np.inf])['count'].sum() == 6
+    # The other database's extracts survive this one's prune
+    assert any(name.startswith(f'review_length-{other.columns.db_key}-') for name in os.listdir('.column_cache'))
+
+
+def _histogram_worker(barrier, results):
+    eda = AmazonEDA('reviews.db')
+    barrier.wait()
+    try:
+        results.put(eda.text_stat_histogram([0, 50, 200, np.inf], category='books')['count'].tolist())
+    except Exception as e:
+        results.put(repr(e))
+    finally:
+        eda.conn.close()
+
+
+def test_concurrent_processes_build_the_same_extracts(eda):
+    for _ in range(5):
+        shutil.rmtree('.column_cache', ignore_errors=True)
+        barrier, results = multiprocessing.Barrier(4), multiprocessing.Queue()
+        workers = [multiprocessing.Process(target=_histogram_worker, args=(barrier, results)) for _ in range(4)]
+        for worker in workers:
+            worker.start()
+        outcomes = [results.get(timeout=30) for _ in workers]
+        for worker in workers:
+            worker.join()
+        assert outcomes == [[2, 1, 0]] * 4
+        assert not [name for name in os.listdir('.column_cache') if name.startswith('.tmp-')]
+
+
+def test_add_text_statistics():
+    df = pd.DataFrame({'reviewText': ['héllo  wide world', None], 'summary': ['ok', None]})
+    stats = add_text_statistics(df)
+    assert stats.loc[0, ['review_length', 'word_count', 'summary_length', 'non_ascii_permille']].tolist() == [17, 3, 2, 58]
+    assert stats.loc[1, ['review_length', 'word_count', 'summary_length', 'non_ascii_permille']].isna().all()
+
+
+def test_ensure_text_statistics_backfills_old_tables(tmp_path):
+    conn = sqlite3.connect(tmp_path / 'old.db')
+    conn.execute("CREATE TABLE reviews (reviewText TEXT, summary TEXT)")
+    conn.executemany("INSERT INTO reviews VALUES (?, ?)", [('two words', 'hi'), (None, None)])
+    conn.commit()
+
+    ensure_text_statistics(conn, chunksize=1)
+    rows = conn.execute(
+        "SELECT review_length, word_count, summary_length, non_ascii_permille FROM reviews ORDER BY rowid"
+    ).fetchall()
+    assert rows == [(9, 2, 2, 0), (None, None, None, None)]
+
+    # Already backfilled: a second call leaves the table alone
+    ensure_text_statistics(conn)
+    conn.close()